@@ -2,64 +2,167 @@
 
 from __future__ import annotations
 
-import hashlib
 import io
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import pikepdf
 from PIL import Image
 
+from accesspdf.processors._pdf_helpers import (
+    FORM_SUBTYPE,
+    IMAGE_SUBTYPE,
+    get_xobjects,
+    iter_form_images,
+)
+from accesspdf.utils.hashing import hash_image_stream
+
 logger = logging.getLogger(__name__)
 
+# Minimum pages per worker before extract_all_images goes parallel.  Each
+# worker reopens the PDF, which only pays off once it has enough pages of
+# decode + hash work to amortize the extra parse.
+_PARALLEL_MIN_PAGES = 8
+
+# Pillow first shrinks by an integer factor with a cheap box reduce until the
+# image is within this factor of the target, then resamples the rest.  At 3.0
+# the result is indistinguishable from a full-size resample.
+_REDUCING_GAP = 3.0
+
+
+@dataclass
+class LazyImage:
+    """An image XObject that is only decoded when first called.
+
+    Holds the PDF path and the XObject's object id rather than pixels, so
+    listing a document's images costs a hash per image, not a full decode.
+    Calling it reopens the PDF, decodes the image once and caches it.
+    """
+
+    pdf_path: Path
+    objgen: tuple[int, int]
+    _image: Image.Image | None = field(default=None, init=False, repr=False)
+
+    def __call__(self) -> Image.Image | None:
+        """Return the decoded image, or None if it cannot be decoded."""
+        if self._image is None:
+            try:
+                with pikepdf.open(self.pdf_path) as pdf:
+                    self._image = _xobj_to_pil(pdf.get_object(self.objgen))
+            except Exception:
+                logger.debug("Could not load image %s", self.objgen, exc_info=True)
+        return self._image
+
 
 def extract_image(pdf_path: Path, image_hash: str) -> Image.Image | None:
     """Extract a specific image from a PDF by its md5 hash.
 
     Returns a Pillow Image or None if not found.
     """
+    visited: set[tuple[int, int]] = set()
     with pikepdf.open(pdf_path) as pdf:
         for page in pdf.pages:
-            result = _search_page(page, image_hash)
+            result = _search_page(page, image_hash, visited)
             if result is not None:
                 return result
     return None
 
 
-def extract_all_images(pdf_path: Path) -> list[tuple[str, int, Image.Image]]:
+def extract_all_images(pdf_path: Path) -> list[tuple[str, int, LazyImage]]:
     """Extract all images from a PDF.
 
-    Returns a list of (hash, page_number, Image) tuples.
-    Deduplicates by hash.
+    Returns a list of (hash, page_number, LazyImage) tuples in page order.
+    Deduplicates by hash.  Pixels are decoded only when a LazyImage is
+    called, so callers that need a few images (or none) don't pay for all.
+    Callers resolving many sidecar entries should make this one pass rather
+    than call :func:`extract_image` per entry, which rescans from page 1.
+
+    Large documents are split into contiguous page ranges that are decoded
+    on a thread pool; each worker opens its own ``pikepdf.Pdf`` because a
+    single handle must not be shared across threads.
     """
-    results: list[tuple[str, int, Image.Image]] = []
+    with pikepdf.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+        workers = min(os.cpu_count() or 1, page_count // _PARALLEL_MIN_PAGES)
+        if workers <= 1:
+            results: list[tuple[str, int, LazyImage]] = []
+            seen: set[str] = set()
+            hash_cache: dict[tuple[int, int], str] = {}
+            visited: set[tuple[int, int]] = set()
+            for page_idx, page in enumerate(pdf.pages, start=1):
+                _collect_page_images(
+                    pdf_path, page, page_idx, seen, results, hash_cache, visited
+                )
+            return results
+
+    step = -(-page_count // workers)  # ceil division
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_collect_page_range, pdf_path, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        chunks = [f.result() for f in futures]
+
+    # Merge in page order so the first occurrence of each hash wins, exactly
+    # as in the sequential path.
+    merged: list[tuple[str, int, LazyImage]] = []
+    merged_seen: set[str] = set()
+    for chunk in chunks:
+        for img_hash, page_num, img in chunk:
+            if img_hash not in merged_seen:
+                merged_seen.add(img_hash)
+                merged.append((img_hash, page_num, img))
+    return merged
+
+
+def _collect_page_range(
+    pdf_path: Path, start: int, stop: int
+) -> list[tuple[str, int, LazyImage]]:
+    """Collect images from pages ``start`` to ``stop`` (0-based, exclusive)."""
+    results: list[tuple[str, int, LazyImage]] = []
     seen: set[str] = set()
-
+    hash_cache: dict[tuple[int, int], str] = {}
+    visited: set[tuple[int, int]] = set()
     with pikepdf.open(pdf_path) as pdf:
-        for page_idx, page in enumerate(pdf.pages, start=1):
-            _collect_page_images(page, page_idx, seen, results)
-
+        for page_idx in range(start, stop):
+            _collect_page_images(
+                pdf_path, pdf.pages[page_idx], page_idx + 1,
+                seen, results, hash_cache, visited,
+            )
     return results
 
 
-def _search_page(page: pikepdf.Page, target_hash: str) -> Image.Image | None:
-    """Search a page for an image with a specific hash."""
-    if "/Resources" not in page or "/XObject" not in page["/Resources"]:
+def _search_page(
+    page: pikepdf.Page,
+    target_hash: str,
+    visited: set[tuple[int, int]] | None = None,
+) -> Image.Image | None:
+    """Search a page for an image with a specific hash.
+
+    *visited* tracks Form XObjects already searched, so a Form shared by
+    many pages is only walked on the first of them.
+    """
+    xobjects = get_xobjects(page)
+    if xobjects is None:
         return None
 
-    for _name, xobj_ref in page["/Resources"]["/XObject"].items():
+    for xobj in xobjects.values():
         try:
-            xobj = xobj_ref.resolve() if hasattr(xobj_ref, "resolve") else xobj_ref
             if not isinstance(xobj, pikepdf.Stream):
                 continue
 
-            subtype = str(xobj.get("/Subtype", ""))
-            if subtype == "/Image":
+            subtype = xobj.get("/Subtype")
+            if subtype == IMAGE_SUBTYPE:
                 result = _try_extract(xobj, target_hash)
                 if result is not None:
                     return result
-            elif subtype == "/Form":
-                result = _search_form(xobj, target_hash)
+            elif subtype == FORM_SUBTYPE:
+                if visited is not None and xobj.objgen in visited:
+                    continue
+                result = _search_form(xobj, target_hash, visited)
                 if result is not None:
                     return result
         except Exception:
@@ -68,20 +171,17 @@ def _search_page(page: pikepdf.Page, target_hash: str) -> Image.Image | None:
     return None
 
 
-def _search_form(form_xobj: pikepdf.Stream, target_hash: str) -> Image.Image | None:
-    """Search inside a Form XObject for an image with a specific hash."""
+def _search_form(
+    form_xobj: pikepdf.Stream,
+    target_hash: str,
+    visited: set[tuple[int, int]] | None = None,
+) -> Image.Image | None:
+    """Search a Form XObject, and any Forms nested in it, for an image."""
     try:
-        resources = form_xobj.get("/Resources")
-        if resources is None or "/XObject" not in resources:
-            return None
-        for _name, inner_ref in resources["/XObject"].items():
-            inner = inner_ref.resolve() if hasattr(inner_ref, "resolve") else inner_ref
-            if not isinstance(inner, pikepdf.Stream):
-                continue
-            if str(inner.get("/Subtype", "")) == "/Image":
-                result = _try_extract(inner, target_hash)
-                if result is not None:
-                    return result
+        for inner in iter_form_images(form_xobj, visited):
+            result = _try_extract(inner, target_hash)
+            if result is not None:
+                return result
     except Exception:
         logger.debug("Error searching form XObject", exc_info=True)
     return None
@@ -89,75 +189,94 @@ def _search_form(form_xobj: pikepdf.Stream, target_hash: str) -> Image.Image | N
 
 def _try_extract(xobj: pikepdf.Stream, target_hash: str) -> Image.Image | None:
     """Check if an XObject matches the target hash and extract as Image."""
-    raw = bytes(xobj.read_raw_bytes())
-    img_hash = hashlib.md5(raw).hexdigest()
+    img_hash = hash_image_stream(xobj)
     if img_hash != target_hash:
         return None
     return _xobj_to_pil(xobj)
 
 
 def _collect_page_images(
+    pdf_path: Path,
     page: pikepdf.Page,
     page_num: int,
     seen: set[str],
-    results: list[tuple[str, int, Image.Image]],
+    results: list[tuple[str, int, LazyImage]],
+    hash_cache: dict[tuple[int, int], str] | None = None,
+    visited: set[tuple[int, int]] | None = None,
 ) -> None:
-    """Collect all images from a page."""
-    if "/Resources" not in page or "/XObject" not in page["/Resources"]:
+    """Collect all images from a page.
+
+    *visited* tracks Form XObjects already walked; images inside a Form
+    shared by several pages are attributed to the first of them, which is
+    what hash deduplication would keep anyway.
+    """
+    xobjects = get_xobjects(page)
+    if xobjects is None:
         return
 
-    for _name, xobj_ref in page["/Resources"]["/XObject"].items():
+    for xobj in xobjects.values():
         try:
-            xobj = xobj_ref.resolve() if hasattr(xobj_ref, "resolve") else xobj_ref
             if not isinstance(xobj, pikepdf.Stream):
                 continue
 
-            subtype = str(xobj.get("/Subtype", ""))
-            if subtype == "/Image":
-                _try_collect(xobj, page_num, seen, results)
-            elif subtype == "/Form":
-                _collect_form_images(xobj, page_num, seen, results)
+            subtype = xobj.get("/Subtype")
+            if subtype == IMAGE_SUBTYPE:
+                _try_collect(pdf_path, xobj, page_num, seen, results, hash_cache)
+            elif subtype == FORM_SUBTYPE:
+                if visited is not None and xobj.objgen in visited:
+                    continue
+                _collect_form_images(
+                    pdf_path, xobj, page_num, seen, results, hash_cache, visited
+                )
         except Exception:
             logger.debug("Error collecting image on page %d", page_num, exc_info=True)
 
 
 def _collect_form_images(
+    pdf_path: Path,
     form_xobj: pikepdf.Stream,
     page_num: int,
     seen: set[str],
-    results: list[tuple[str, int, Image.Image]],
+    results: list[tuple[str, int, LazyImage]],
+    hash_cache: dict[tuple[int, int], str] | None = None,
+    visited: set[tuple[int, int]] | None = None,
 ) -> None:
-    """Collect images from inside a Form XObject."""
+    """Collect images from a Form XObject and any Forms nested in it."""
     try:
-        resources = form_xobj.get("/Resources")
-        if resources is None or "/XObject" not in resources:
-            return
-        for _name, inner_ref in resources["/XObject"].items():
-            inner = inner_ref.resolve() if hasattr(inner_ref, "resolve") else inner_ref
-            if not isinstance(inner, pikepdf.Stream):
-                continue
-            if str(inner.get("/Subtype", "")) == "/Image":
-                _try_collect(inner, page_num, seen, results)
+        for inner in iter_form_images(form_xobj, visited):
+            _try_collect(pdf_path, inner, page_num, seen, results, hash_cache)
     except Exception:
         logger.debug("Error collecting form images", exc_info=True)
 
 
 def _try_collect(
+    pdf_path: Path,
     xobj: pikepdf.Stream,
     page_num: int,
     seen: set[str],
-    results: list[tuple[str, int, Image.Image]],
+    results: list[tuple[str, int, LazyImage]],
+    hash_cache: dict[tuple[int, int], str] | None = None,
 ) -> None:
-    """Try to extract an image XObject and add it to results."""
-    raw = bytes(xobj.read_raw_bytes())
-    img_hash = hashlib.md5(raw).hexdigest()
+    """Hash an image XObject and add a lazy handle for it to results."""
+    img_hash = hash_image_stream(xobj, hash_cache)
     if img_hash in seen:
         return
     seen.add(img_hash)
+    results.append((img_hash, page_num, LazyImage(pdf_path, xobj.objgen)))
 
-    img = _xobj_to_pil(xobj)
-    if img is not None:
-        results.append((img_hash, page_num, img))
+
+# (channels, BitsPerComponent) -> (Pillow mode, raw unpacker) for the raw
+# decode fallback.  Pillow's unpackers expand 1/2/4-bit gray samples to the
+# full 0-255 range and keep the high byte of 16-bit samples.
+_RAW_MODES: dict[tuple[int, int], tuple[str, str]] = {
+    (1, 1): ("1", "1"),
+    (1, 2): ("L", "L;2"),
+    (1, 4): ("L", "L;4"),
+    (1, 8): ("L", "L"),
+    (1, 16): ("L", "L;16B"),
+    (3, 8): ("RGB", "RGB"),
+    (3, 16): ("RGB", "RGB;16B"),
+}
 
 
 def _xobj_to_pil(xobj: pikepdf.Stream) -> Image.Image | None:
@@ -188,7 +307,7 @@ def _xobj_to_pil(xobj: pikepdf.Stream) -> Image.Image | None:
 
     # Fallback: try to decode decompressed bytes
     try:
-        raw = bytes(xobj.read_bytes())
+        raw = xobj.read_bytes()
         w = int(xobj.get("/Width", 0))
         h = int(xobj.get("/Height", 0))
         bpc = int(xobj.get("/BitsPerComponent", 8))
@@ -198,15 +317,24 @@ def _xobj_to_pil(xobj: pikepdf.Stream) -> Image.Image | None:
             return None
 
         if "/DeviceRGB" in cs or "/RGB" in cs:
-            mode = "RGB"
+            channels = 3
         elif "/DeviceGray" in cs or "/Gray" in cs:
-            mode = "L"
+            channels = 1
         else:
-            mode = "RGB"
+            channels = 3
+
+        modes = _RAW_MODES.get((channels, bpc))
+        if modes is None:
+            return None
+        mode, rawmode = modes
 
-        expected_size = w * h * (3 if mode == "RGB" else 1) * (bpc // 8)
+        # Rows are padded to a whole byte, which Pillow's unpackers expect too.
+        expected_size = (w * channels * bpc + 7) // 8 * h
         if len(raw) >= expected_size:
-            img = Image.frombytes(mode, (w, h), raw[:expected_size])
+            # Decode straight from the stream buffer instead of slicing a copy
+            # first: frombuffer maps "L" data in place and the raw decoder
+            # ignores any trailing padding.
+            img = Image.frombuffer(mode, (w, h), raw, "raw", rawmode, 0, 1)
             return _ensure_rgb(img)
     except Exception:
         logger.debug("Raw image decode failed", exc_info=True)
@@ -214,35 +342,69 @@ def _xobj_to_pil(xobj: pikepdf.Stream) -> Image.Image | None:
     return None
 
 
-def prepare_for_ai(img: Image.Image, *, max_dim: int = 512) -> bytes:
-    """Resize a PIL image and return PNG bytes ready for an AI provider.
+def prepare_for_ai(
+    img: Image.Image,
+    *,
+    max_dim: int = 512,
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
+    fmt: str = "PNG",
+) -> bytes:
+    """Resize a PIL image and return encoded bytes ready for an AI provider.
 
     Vision models don't need full-resolution PDF images.  Downsizing to
     *max_dim* pixels on the longest side dramatically reduces payload size
     and inference time while preserving enough detail for alt-text generation.
+    BICUBIC is the default filter: at these sizes it is indistinguishable
+    from LANCZOS for a vision model and noticeably cheaper.  Very large
+    images are box-reduced first, so the filter only runs over a few times
+    the target size rather than the full page scan.
+
+    *fmt* is the output encoding (``"PNG"`` or ``"JPEG"``).  Callers that ask
+    for JPEG must set ``ImageContext.mime_type`` to ``"image/jpeg"``.
     """
     # Resize if larger than max_dim on either axis
     w, h = img.size
     if max(w, h) > max_dim:
-        scale = max_dim / max(w, h)
-        new_w = max(1, int(w * scale))
-        new_h = max(1, int(h * scale))
-        img = img.resize((new_w, new_h), Image.LANCZOS)
+        if img.format == "JPEG":
+            # Let libjpeg decode at a reduced DCT scale instead of producing
+            # full-resolution pixels only to throw them away.  No-op if the
+            # image has already been loaded.
+            img.draft(img.mode, (max_dim, max_dim))
+        cur_w, cur_h = img.size
+        scale = max_dim / max(cur_w, cur_h)
+        new_w = max(1, int(cur_w * scale))
+        new_h = max(1, int(cur_h * scale))
+        img = img.resize((new_w, new_h), resample, reducing_gap=_REDUCING_GAP)
         logger.debug("Resized image from %dx%d to %dx%d for AI", w, h, new_w, new_h)
 
     buf = io.BytesIO()
-    img.save(buf, format="PNG")
+    if fmt.upper() == "JPEG":
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+        img.save(buf, format="JPEG", quality=85)
+    elif fmt.upper() == "PNG":
+        # The payload is sent once and discarded; fast zlib settings cut
+        # encode time severalfold for a few percent more bytes.
+        img.save(buf, format="PNG", compress_level=1)
+    else:
+        img.save(buf, format=fmt)
     return buf.getvalue()
 
 
+# Target mode for each source mode: None keeps the image as-is.  Bilevel
+# images widen to L, other alpha modes become RGBA (PNG supports it), and
+# anything unlisted (P, I, F, CMYK, ...) becomes RGB.
+_MODE_CONVERT: dict[str, str | None] = {
+    "RGB": None,
+    "L": None,
+    "1": "L",
+    "RGBA": None,
+    "LA": "RGBA",
+    "PA": "RGBA",
+}
+
+
 def _ensure_rgb(img: Image.Image) -> Image.Image:
     """Convert any image mode (CMYK, P, LA, etc.) to RGB for safe PNG export."""
-    if img.mode in ("RGB", "L"):
-        return img
-    if img.mode == "CMYK":
-        return img.convert("RGB")
-    if img.mode in ("RGBA", "LA", "PA"):
-        # Keep alpha by converting to RGBA, which PNG supports
-        return img.convert("RGBA")
-    # Catch-all for any other mode (P, I, F, etc.)
-    return img.convert("RGB")
+    target = _MODE_CONVERT.get(img.mode, "RGB")
+    return img if target is None else img.convert(target)
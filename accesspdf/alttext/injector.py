@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
-import hashlib
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 
 import pikepdf
 
 from accesspdf.alttext.sidecar import SidecarFile
 from accesspdf.models import AltTextStatus
-from accesspdf.processors._pdf_helpers import add_kid, make_struct_elem, parse_content_stream_safe
+from accesspdf.processors._pdf_helpers import (
+    FORM_SUBTYPE,
+    IMAGE_SUBTYPE,
+    add_kid,
+    get_xobjects,
+    iter_form_images,
+    make_struct_elem,
+    parse_content_stream_safe,
+)
+from accesspdf.utils.hashing import hash_image_stream, prehash_pdf_images
 
 logger = logging.getLogger(__name__)
 
+# Built once: constructing these goes through the pikepdf bindings, and the
+# content-stream loops below compare against them for every operator.
+_OP_BDC = pikepdf.Operator("BDC")
+_OP_DO = pikepdf.Operator("Do")
+_OP_EMC = pikepdf.Operator("EMC")
+_N_ALT = pikepdf.Name("/Alt")
+_N_ACTUAL_TEXT = pikepdf.Name("/ActualText")
+_N_FIGURE = pikepdf.Name("/Figure")
+_EMPTY_STRING = pikepdf.String("")
+
 
 def inject_alt_text(pdf_path: Path, sidecar: SidecarFile) -> int:
     """Inject approved/decorative alt text entries into the PDF at *pdf_path*.
@@ -35,19 +54,29 @@ def inject_alt_text(pdf_path: Path, sidecar: SidecarFile) -> int:
             logger.warning("PDF has no structure tree -- cannot inject alt text.")
             return 0
 
-        # Build lookup: hash -> (alt_text, is_decorative)
+        # Build lookup: hash -> (alt_text, is_decorative), plus the 0-based
+        # page each image was recorded on as a hint for where to look first
         entry_lookup: dict[str, tuple[str, bool]] = {}
+        entry_pages: dict[str, int] = {}
         for entry in actionable:
             is_deco = entry.status == AltTextStatus.DECORATIVE
             entry_lookup[entry.hash] = (entry.alt_text, is_deco)
+            entry_pages[entry.hash] = entry.page - 1
 
         # First pass: update existing /Figure tags (e.g. from PowerPoint exports)
+        # Both passes hash the same image XObjects; share the digests.  When
+        # every entry has a usable page hint the second pass only visits those
+        # pages, so hashing the whole document up front would be wasted work.
         struct_root = pdf.Root["/StructTreeRoot"]
-        count += _update_existing_figures(struct_root, entry_lookup, pdf)
+        page_count = len(pdf.pages)
+        xobj_hash_cache: dict[tuple[int, int], str] = {}
+        if not all(0 <= p < page_count for p in entry_pages.values()):
+            xobj_hash_cache = prehash_pdf_images(pdf_path, page_count)
+        count += _update_existing_figures(pdf, struct_root, entry_lookup, xobj_hash_cache)
 
         # Second pass: create new /Figure tags with marked content for remaining
         if entry_lookup:
-            count += _create_figure_tags(pdf, entry_lookup)
+            count += _create_figure_tags(pdf, entry_lookup, xobj_hash_cache, entry_pages)
 
         pdf.save(pdf_path)
 
@@ -56,135 +85,178 @@ def inject_alt_text(pdf_path: Path, sidecar: SidecarFile) -> int:
 
 
 def _update_existing_figures(
-    node: pikepdf.Object,
-    entry_lookup: dict[str, tuple[str, bool]],
     pdf: pikepdf.Pdf,
+    struct_root: pikepdf.Object,
+    entry_lookup: dict[str, tuple[str, bool]],
+    xobj_hash_cache: dict[tuple[int, int], str] | None = None,
 ) -> int:
-    """Walk the structure tree updating any existing /Figure tags with /Alt."""
+    """Fill in /Alt on existing /Figure tags that don't have it yet.
+
+    Figures that need alt text are taken from one lazy walk of the tag tree;
+    each page's image hashes are computed once and shared by every figure on
+    that page.  Matched entries are removed from *entry_lookup*, and the walk
+    ends as soon as it is empty.
+    """
+    page_index = _build_page_index(pdf)
+    page_hash_cache: dict[tuple[int, int], list[str]] = {}
     count = 0
-    try:
-        if "/S" in node and str(node["/S"]) == "/Figure":
-            if "/Alt" not in node or not str(node["/Alt"]).strip():
-                page_idx = _get_page_index(node, pdf)
-                if page_idx is not None:
-                    img_hash = _match_page_image(pdf, page_idx, entry_lookup)
-                    if img_hash is not None:
-                        alt_text, is_deco = entry_lookup[img_hash]
-                        if is_deco:
-                            node[pikepdf.Name("/Alt")] = pikepdf.String("")
-                            node[pikepdf.Name("/ActualText")] = pikepdf.String("")
-                        else:
-                            node[pikepdf.Name("/Alt")] = pikepdf.String(alt_text)
-                        del entry_lookup[img_hash]
-                        count += 1
-
-        if "/K" in node:
-            kids = node["/K"]
-            if isinstance(kids, pikepdf.Array):
-                for child in kids:
-                    if isinstance(child, pikepdf.Dictionary):
-                        count += _update_existing_figures(child, entry_lookup, pdf)
-            elif isinstance(kids, pikepdf.Dictionary):
-                count += _update_existing_figures(kids, entry_lookup, pdf)
-    except Exception:
-        logger.debug("Error walking struct tree during injection", exc_info=True)
+    for node, page_idx in _iter_figures_needing_alt(struct_root, page_index):
+        img_hash = _match_page_image(
+            pdf, page_idx, entry_lookup, page_hash_cache, xobj_hash_cache
+        )
+        if img_hash is None:
+            continue
+        alt_text, is_deco = entry_lookup.pop(img_hash)
+        if is_deco:
+            node[_N_ALT] = _EMPTY_STRING
+            node[_N_ACTUAL_TEXT] = _EMPTY_STRING
+        else:
+            node[_N_ALT] = pikepdf.String(alt_text)
+        count += 1
+        if not entry_lookup:
+            break
     return count
 
 
+def _iter_figures_needing_alt(
+    struct_root: pikepdf.Object,
+    page_index: dict[tuple[int, int], int],
+) -> Iterator[tuple[pikepdf.Object, int]]:
+    """Yield (node, page index) for each /Figure without /Alt, in tree order.
+
+    The walk uses an explicit stack, so deep tag trees can't exhaust the
+    recursion limit, and it is lazy: the caller stops it as soon as every
+    entry has been placed.
+    """
+    stack: list[pikepdf.Object] = [struct_root]
+    seen: set[tuple[int, int]] = set()
+    while stack:
+        node = stack.pop()
+        key = node.objgen
+        if key != (0, 0):
+            if key in seen:  # malformed trees can loop back via /K
+                continue
+            seen.add(key)
+        try:
+            if node.get("/S") == _N_FIGURE:
+                if "/Alt" not in node or not str(node["/Alt"]).strip():
+                    page_idx = _get_page_index(node, page_index)
+                    if page_idx is not None:
+                        yield node, page_idx
+
+            if "/K" in node:
+                # Reversed so children pop off the stack in document order
+                stack.extend(
+                    child for child in reversed(_as_list(node["/K"]))
+                    if isinstance(child, pikepdf.Dictionary)
+                )
+        except Exception:
+            logger.debug("Error walking struct tree during injection", exc_info=True)
+
+
 def _create_figure_tags(
     pdf: pikepdf.Pdf,
     entry_lookup: dict[str, tuple[str, bool]],
+    xobj_hash_cache: dict[tuple[int, int], str] | None = None,
+    entry_pages: dict[str, int] | None = None,
 ) -> int:
-    """Create /Figure elements linked to images via BDC/EMC marked content."""
+    """Create /Figure elements linked to images via BDC/EMC marked content.
+
+    *entry_pages* maps image hashes to the 0-based page the sidecar recorded
+    them on.  Those pages are visited first, in order, so a document whose
+    remaining images are all where the sidecar says is done without hashing
+    any other page.  The rest are still searched if hashes are left over,
+    since a sidecar can be older than the PDF it is applied to.
+    """
     count = 0
     struct_root = pdf.Root["/StructTreeRoot"]
 
     # Find the /Document element (first child of StructTreeRoot)
-    doc_elem = None
-    if "/K" in struct_root:
-        kids = struct_root["/K"]
-        if isinstance(kids, pikepdf.Array) and len(kids) > 0:
-            doc_elem = kids[0]
-        elif isinstance(kids, pikepdf.Dictionary):
-            doc_elem = kids
+    kids = _as_list(struct_root.get("/K"))
+    doc_elem = kids[0] if kids else None
     if doc_elem is None:
         doc_elem = struct_root
 
-    for page_idx, page in enumerate(pdf.pages):
+    for page_idx in _page_visit_order(len(pdf.pages), entry_lookup, entry_pages):
         if not entry_lookup:
             break
 
+        page = pdf.pages[page_idx]
         page_obj = page.obj if hasattr(page, "obj") else page
 
         # Build XObject name -> hash mapping for this page
-        name_hash_map = _get_page_image_name_hashes(page)
+        name_hash_map = _get_page_image_name_hashes(page, xobj_hash_cache)
         if not name_hash_map:
             continue
 
-        # Find which images on this page need tagging
-        to_tag: list[tuple[str, str]] = []
-        for xobj_name, img_hash in name_hash_map.items():
-            if img_hash in entry_lookup:
-                to_tag.append((xobj_name, img_hash))
+        # Find which images on this page need tagging, keyed by the Name
+        # operand a Do would carry (/Im0) so each Do is one dict lookup.
+        to_tag = {
+            pikepdf.Name(xobj_name): img_hash
+            for xobj_name, img_hash in name_hash_map.items()
+            if img_hash in entry_lookup
+        }
         if not to_tag:
             continue
 
-        # Find the next available MCID on this page
-        mcid = _get_next_mcid(page)
-
-        # Parse content stream
         ops = parse_content_stream_safe(page, page_idx)
         if ops is None:
             continue
 
-        # Wrap matching Do commands with BDC/EMC marked content
+        # Wrap matching Do commands with BDC/EMC marked content.  Each name
+        # is popped when tagged, so repeated Do's of one image get one tag.
+        # New MCIDs must sit above every existing one on the page, including
+        # BDCs that come later in the stream, so the same pass records the
+        # highest MCID seen and numbers the new figures once it is done.
         new_ops: list[tuple[list, pikepdf.Operator]] = []
-        tagged_names: set[str] = set()
+        pending: list[tuple[pikepdf.Dictionary, pikepdf.Object]] = []
+        max_mcid = -1
 
         for operands, operator in ops:
-            if operator == pikepdf.Operator("Do") and len(operands) == 1:
-                do_name = str(operands[0])
-                matched = None
-                for xobj_name, img_hash in to_tag:
-                    if do_name == f"/{xobj_name}" or do_name == xobj_name:
-                        if xobj_name not in tagged_names:
-                            matched = (xobj_name, img_hash)
-                            break
-
-                if matched:
-                    xobj_name, img_hash = matched
+            if operator == _OP_BDC and len(operands) >= 2:
+                props = operands[1]
+                if isinstance(props, pikepdf.Dictionary) and "/MCID" in props:
+                    max_mcid = max(max_mcid, int(props["/MCID"]))
+                new_ops.append((operands, operator))
+            elif (operator == _OP_DO and len(operands) == 1
+                    and isinstance(operands[0], pikepdf.Name)):
+                img_hash = to_tag.pop(operands[0], None)
+                if img_hash is not None and img_hash in entry_lookup:
                     alt_text, is_deco = entry_lookup[img_hash]
 
-                    # BDC ... Do ... EMC
+                    # BDC ... Do ... EMC; /MCID is filled in after the pass
+                    props = pikepdf.Dictionary()
                     new_ops.append((
-                        [pikepdf.Name("/Figure"),
-                         pikepdf.Dictionary({"/MCID": mcid})],
-                        pikepdf.Operator("BDC"),
+                        [_N_FIGURE, props],
+                        _OP_BDC,
                     ))
                     new_ops.append((operands, operator))
-                    new_ops.append(([], pikepdf.Operator("EMC")))
+                    new_ops.append(([], _OP_EMC))
 
-                    # Create /Figure structure element linked via MCID
+                    # Create /Figure structure element, linked via MCID below
                     figure = make_struct_elem(
                         pdf, "Figure", doc_elem,
-                        page=page_obj, mcid=mcid,
+                        page=page_obj,
                         alt="" if is_deco else alt_text,
                     )
                     if is_deco:
-                        figure[pikepdf.Name("/ActualText")] = pikepdf.String("")
+                        figure[_N_ACTUAL_TEXT] = _EMPTY_STRING
                     add_kid(doc_elem, figure)
+                    pending.append((props, figure))
 
-                    tagged_names.add(xobj_name)
                     del entry_lookup[img_hash]
-                    count += 1
-                    mcid += 1
                 else:
                     new_ops.append((operands, operator))
             else:
                 new_ops.append((operands, operator))
 
+        for mcid, (props, figure) in enumerate(pending, start=max_mcid + 1):
+            props["/MCID"] = mcid
+            figure["/K"] = pikepdf.Array([mcid])
+
         # Replace content stream if we tagged any images
-        if tagged_names:
+        if pending:
+            count += len(pending)
             try:
                 new_content = pikepdf.unparse_content_stream(new_ops)
                 page["/Contents"] = pdf.make_stream(new_content)
@@ -192,7 +264,8 @@ def _create_figure_tags(
                 logger.debug("Could not rewrite content stream for page %d", page_idx)
 
     # Rebuild parent tree to include the new Figure elements
-    _rebuild_parent_tree(pdf)
+    if count:
+        _rebuild_parent_tree(pdf)
 
     return count
 
@@ -200,77 +273,97 @@ def _create_figure_tags(
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
 
-def _get_page_image_name_hashes(page: pikepdf.Page) -> dict[str, str]:
+def _page_visit_order(
+    page_count: int,
+    entry_lookup: dict[str, tuple[str, bool]],
+    entry_pages: dict[str, int] | None,
+) -> Iterator[int]:
+    """Yield page indices, hinted pages of the remaining entries first."""
+    hinted: list[int] = []
+    if entry_pages:
+        hinted = sorted({
+            entry_pages[h] for h in entry_lookup
+            if h in entry_pages and 0 <= entry_pages[h] < page_count
+        })
+    yield from hinted
+
+    skip = set(hinted)
+    for page_idx in range(page_count):
+        if page_idx not in skip:
+            yield page_idx
+
+
+def _get_page_image_name_hashes(
+    page: pikepdf.Page,
+    xobj_cache: dict[tuple[int, int], str] | None = None,
+) -> dict[str, str]:
     """Get XObject name -> md5 hash mapping for image XObjects on a page."""
     result: dict[str, str] = {}
-    if "/Resources" not in page or "/XObject" not in page["/Resources"]:
+    xobjects = get_xobjects(page)
+    if xobjects is None:
         return result
-    for name, xobj_ref in page["/Resources"]["/XObject"].items():
+    for name, xobj in xobjects.items():
         try:
-            xobj = xobj_ref.resolve() if hasattr(xobj_ref, "resolve") else xobj_ref
             if not isinstance(xobj, pikepdf.Stream):
                 continue
-            if str(xobj.get("/Subtype", "")) == "/Image":
-                raw = bytes(xobj.read_raw_bytes())
-                result[name] = hashlib.md5(raw).hexdigest()
+            if xobj.get("/Subtype") == IMAGE_SUBTYPE:
+                result[name] = hash_image_stream(xobj, xobj_cache)
         except Exception:
             pass
     return result
 
 
-def _get_page_image_hashes(page: pikepdf.Page) -> list[str]:
-    """Get md5 hashes of all image XObjects on a page."""
+def _get_page_image_hashes(
+    page: pikepdf.Page,
+    cache: dict[tuple[int, int], list[str]] | None = None,
+    xobj_cache: dict[tuple[int, int], str] | None = None,
+) -> list[str]:
+    """Get md5 hashes of all image XObjects on a page.
+
+    When *cache* is given, results are memoized by the page's object id so
+    repeated lookups (one per /Figure on the page) hash each image once.
+    *xobj_cache* memoizes individual XObject digests across pages.
+    """
+    if cache is not None:
+        key = page.obj.objgen
+        cached = cache.get(key)
+        if cached is None:
+            cached = cache[key] = _get_page_image_hashes(page, xobj_cache=xobj_cache)
+        return cached
+
     hashes: list[str] = []
-    if "/Resources" not in page or "/XObject" not in page["/Resources"]:
+    xobjects = get_xobjects(page)
+    if xobjects is None:
         return hashes
-    for _name, xobj_ref in page["/Resources"]["/XObject"].items():
+    visited: set[tuple[int, int]] = set()
+    for xobj in xobjects.values():
         try:
-            xobj = xobj_ref.resolve() if hasattr(xobj_ref, "resolve") else xobj_ref
             if not isinstance(xobj, pikepdf.Stream):
                 continue
-            subtype = str(xobj.get("/Subtype", ""))
-            if subtype == "/Image":
-                raw = bytes(xobj.read_raw_bytes())
-                hashes.append(hashlib.md5(raw).hexdigest())
-            elif subtype == "/Form":
-                _collect_form_image_hashes(xobj, hashes)
+            subtype = xobj.get("/Subtype")
+            if subtype == IMAGE_SUBTYPE:
+                hashes.append(hash_image_stream(xobj, xobj_cache))
+            elif subtype == FORM_SUBTYPE and xobj.objgen not in visited:
+                _collect_form_image_hashes(xobj, hashes, xobj_cache, visited)
         except Exception:
             pass
     return hashes
 
 
-def _collect_form_image_hashes(form_xobj: pikepdf.Stream, hashes: list[str]) -> None:
-    """Collect image hashes from inside a Form XObject."""
+def _collect_form_image_hashes(
+    form_xobj: pikepdf.Stream,
+    hashes: list[str],
+    xobj_cache: dict[tuple[int, int], str] | None = None,
+    visited: set[tuple[int, int]] | None = None,
+) -> None:
+    """Collect image hashes from a Form XObject and any Forms nested in it."""
     try:
-        resources = form_xobj.get("/Resources")
-        if resources is None or "/XObject" not in resources:
-            return
-        for _name, inner_ref in resources["/XObject"].items():
-            inner = inner_ref.resolve() if hasattr(inner_ref, "resolve") else inner_ref
-            if not isinstance(inner, pikepdf.Stream):
-                continue
-            if str(inner.get("/Subtype", "")) == "/Image":
-                raw = bytes(inner.read_raw_bytes())
-                hashes.append(hashlib.md5(raw).hexdigest())
+        for inner in iter_form_images(form_xobj, visited):
+            hashes.append(hash_image_stream(inner, xobj_cache))
     except Exception:
         pass
 
 
-def _get_next_mcid(page: pikepdf.Object) -> int:
-    """Find the next available MCID on a page by scanning the content stream."""
-    max_mcid = -1
-    ops = parse_content_stream_safe(page)
-    if ops is not None:
-        for operands, operator in ops:
-            if operator == pikepdf.Operator("BDC") and len(operands) >= 2:
-                props = operands[1]
-                if isinstance(props, pikepdf.Dictionary) and "/MCID" in props:
-                    mcid_val = int(props["/MCID"])
-                    if mcid_val > max_mcid:
-                        max_mcid = mcid_val
-    return max_mcid + 1
-
-
 def _rebuild_parent_tree(pdf: pikepdf.Pdf) -> None:
     """Merge new structure elements into the existing ParentTree.
 
@@ -281,13 +374,8 @@ def _rebuild_parent_tree(pdf: pikepdf.Pdf) -> None:
     """
     struct_root = pdf.Root["/StructTreeRoot"]
 
-    doc_elem = None
-    if "/K" in struct_root:
-        kids = struct_root["/K"]
-        if isinstance(kids, pikepdf.Array) and len(kids) > 0:
-            doc_elem = kids[0]
-        elif isinstance(kids, pikepdf.Dictionary):
-            doc_elem = kids
+    kids = _as_list(struct_root.get("/K"))
+    doc_elem = kids[0] if kids else None
     if doc_elem is None:
         return
 
@@ -320,9 +408,9 @@ def _rebuild_parent_tree(pdf: pikepdf.Pdf) -> None:
     if "/K" not in doc_elem:
         return
 
-    all_kids = doc_elem["/K"]
-    if not isinstance(all_kids, pikepdf.Array):
-        all_kids = pikepdf.Array([all_kids])
+    all_kids = _as_list(doc_elem["/K"])
+
+    page_index = _build_page_index(pdf)
 
     for kid in all_kids:
         if not isinstance(kid, pikepdf.Dictionary):
@@ -347,35 +435,26 @@ def _rebuild_parent_tree(pdf: pikepdf.Pdf) -> None:
         if not mcids:
             continue
 
-        page_ref = kid["/Pg"]
-        for idx, pg in enumerate(pdf.pages):
-            pg_obj = pg.obj if hasattr(pg, "obj") else pg
-            try:
-                if pg_obj.objgen == page_ref.objgen:
-                    if idx not in page_arrays:
-                        page_arrays[idx] = []
-                    arr = page_arrays[idx]
-                    for m in mcids:
-                        # Grow the array if needed
-                        while len(arr) <= m:
-                            arr.append(None)
-                        # Only fill empty slots -- don't overwrite existing entries
-                        if arr[m] is None:
-                            arr[m] = kid
-                    break
-            except Exception:
-                pass
-
-    # ── 3. Write back, using pikepdf.Null() for empty slots ──────────
+        try:
+            idx = page_index.get(kid["/Pg"].objgen)
+        except Exception:
+            continue
+        if idx is None:
+            continue
+        arr = page_arrays.setdefault(idx, [])
+        # Grow the array once to cover the highest MCID
+        top = max(mcids)
+        if len(arr) <= top:
+            arr.extend([None] * (top + 1 - len(arr)))
+        for m in mcids:
+            # Only fill empty slots -- don't overwrite existing entries
+            if arr[m] is None:
+                arr[m] = kid
+
+    # ── 3. Write back; pikepdf stores None as a PDF null for empty slots ─
     nums = pikepdf.Array()
     for page_idx in sorted(page_arrays.keys()):
-        arr = page_arrays[page_idx]
-        pdf_arr = pikepdf.Array()
-        for elem in arr:
-            if elem is None:
-                pdf_arr.append(pikepdf.Null())
-            else:
-                pdf_arr.append(elem)
+        pdf_arr = pikepdf.Array(page_arrays[page_idx])
         nums.append(page_idx)
         nums.append(pdf.make_indirect(pdf_arr))
 
@@ -386,46 +465,54 @@ def _match_page_image(
     pdf: pikepdf.Pdf,
     page_idx: int,
     entry_lookup: dict[str, tuple[str, bool]],
+    page_hash_cache: dict[tuple[int, int], list[str]] | None = None,
+    xobj_hash_cache: dict[tuple[int, int], str] | None = None,
 ) -> str | None:
     """Try to match an image on a page to an entry. Returns the hash or None."""
     if page_idx >= len(pdf.pages):
         return None
     page = pdf.pages[page_idx]
-    hashes = _get_page_image_hashes(page)
-    for img_hash in hashes:
-        if img_hash in entry_lookup:
-            return img_hash
-    return None
+    hashes = _get_page_image_hashes(page, page_hash_cache, xobj_hash_cache)
+    # First match in page order -- a set intersection would make the choice
+    # depend on the string hash seed and break idempotent output.
+    return next((h for h in hashes if h in entry_lookup), None)
 
 
-def _get_page_index(node: pikepdf.Object, pdf: pikepdf.Pdf) -> int | None:
-    """Determine which page a structure element belongs to."""
+def _build_page_index(pdf: pikepdf.Pdf) -> dict[tuple[int, int], int]:
+    """Map each page's objgen to its 0-based index for O(1) /Pg lookups."""
+    return {page.obj.objgen: idx for idx, page in enumerate(pdf.pages)}
+
+
+def _as_list(obj: pikepdf.Object | None) -> list:
+    """Normalize a ``/K`` value to a list of its children.
+
+    ``/K`` may hold an array of kids, a single dictionary kid, or a bare
+    MCID integer; only the first two carry structure children.
+    """
+    if isinstance(obj, pikepdf.Array):
+        return list(obj)
+    if isinstance(obj, pikepdf.Dictionary):
+        return [obj]
+    return []
+
+
+def _get_page_index(
+    node: pikepdf.Object, page_index: dict[tuple[int, int], int]
+) -> int | None:
+    """Determine which page a structure element belongs to.
+
+    *page_index* is the objgen -> index map from :func:`_build_page_index`.
+    """
     if "/Pg" in node:
-        try:
-            page_ref = node["/Pg"]
-            if hasattr(page_ref, "resolve"):
-                page_ref = page_ref.resolve()
-            for idx, pg in enumerate(pdf.pages):
-                pg_obj = pg.obj if hasattr(pg, "obj") else pg
-                if pg_obj.same_owner_as(page_ref) and pg_obj.objgen == page_ref.objgen:
-                    return idx
-        except Exception:
-            pass
+        idx = page_index.get(node["/Pg"].objgen)
+        if idx is not None:
+            return idx
 
     if "/K" in node:
-        kids = node["/K"]
-        items = kids if isinstance(kids, pikepdf.Array) else [kids]
-        for child in items:
+        for child in _as_list(node["/K"]):
             if isinstance(child, pikepdf.Dictionary) and "/Pg" in child:
-                try:
-                    page_ref = child["/Pg"]
-                    if hasattr(page_ref, "resolve"):
-                        page_ref = page_ref.resolve()
-                    for idx, pg in enumerate(pdf.pages):
-                        pg_obj = pg.obj if hasattr(pg, "obj") else pg
-                        if pg_obj.same_owner_as(page_ref) and pg_obj.objgen == page_ref.objgen:
-                            return idx
-                except Exception:
-                    pass
+                idx = page_index.get(child["/Pg"].objgen)
+                if idx is not None:
+                    return idx
 
     return None
@@ -10,15 +10,33 @@ Image IDs are based on ``md5(image_bytes)`` so they survive PDF re-exports.
 
 from __future__ import annotations
 
+import threading
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator
+from typing import Iterable, Iterator
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from accesspdf.models import AltTextStatus, ImageInfo
 
+# libyaml-backed loader/dumper when PyYAML was built with it; they are several
+# times faster than the pure-Python ones and produce the same documents.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parsed YAML from load_or_create, keyed by resolved path and holding
+# (file text, parsed data).  A hit needs the file's text to match exactly,
+# so a same-size rewrite within one mtime tick is never missed; it skips
+# only the YAML parse, and each caller still gets freshly built models.
+# Only a long-lived process that reloads an unchanged sidecar hits it (the
+# web app, or re-running the pipeline on one output); a one-shot CLI call
+# always misses.  Oldest insertions are evicted.  Web worker threads share
+# it, hence the lock.
+_LOAD_CACHE_MAX = 8
+_load_cache: dict[str, tuple[str, dict]] = {}
+_load_cache_lock = threading.Lock()
 
 class AltTextEntry(BaseModel):
     """A single image entry in the sidecar file."""
@@ -45,19 +63,39 @@ class SidecarFile(BaseModel):
     generated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     images: list[AltTextEntry] = Field(default_factory=list)
 
+    # Lookup indices over ``images`` mapping each key to the position of its
+    # first entry, plus a shallow copy of the list they were built from.
+    # Comparing that copy with ``images`` is one C-level pass that mostly
+    # compares pointers, so any edit to the list -- replacing, reordering or
+    # swapping in a new list -- triggers a rebuild.  Positions stay valid
+    # while the two compare equal, and the live entry is always returned.
+    _by_hash: dict[str, int] = PrivateAttr(default_factory=dict)
+    _by_id: dict[str, int] = PrivateAttr(default_factory=dict)
+    _indexed: list[AltTextEntry] | None = PrivateAttr(default=None)
+
+    def _index(self) -> None:
+        """Make sure the hash/id indices reflect ``images``."""
+        if self._indexed is not None and self._indexed == self.images:
+            return
+        self._by_hash = {}
+        self._by_id = {}
+        for pos, entry in enumerate(self.images):
+            # setdefault keeps the first entry, matching a front-to-back scan
+            self._by_hash.setdefault(entry.hash, pos)
+            self._by_id.setdefault(entry.id, pos)
+        self._indexed = list(self.images)
+
     def get_entry(self, image_hash: str) -> AltTextEntry | None:
         """Look up an entry by its full md5 hash."""
-        for entry in self.images:
-            if entry.hash == image_hash:
-                return entry
-        return None
+        self._index()
+        pos = self._by_hash.get(image_hash)
+        return None if pos is None else self.images[pos]
 
     def get_entry_by_id(self, entry_id: str) -> AltTextEntry | None:
         """Look up an entry by its short id (e.g. 'img_a3f8c2')."""
-        for entry in self.images:
-            if entry.id == entry_id:
-                return entry
-        return None
+        self._index()
+        pos = self._by_id.get(entry_id)
+        return None if pos is None else self.images[pos]
 
     def upsert(self, image: ImageInfo, *, ai_draft: str = "", alt_text: str = "",
                status: AltTextStatus | None = None) -> AltTextEntry:
@@ -86,7 +124,13 @@ class SidecarFile(BaseModel):
             alt_text=alt_text,
             status=status or AltTextStatus.NEEDS_REVIEW,
         )
+        # get_entry above left the indices in sync; keep them that way
+        pos = len(self.images)
         self.images.append(entry)
+        self._by_hash.setdefault(entry.hash, pos)
+        self._by_id.setdefault(entry.id, pos)
+        if self._indexed is not None:
+            self._indexed.append(entry)
         return entry
 
     def approved_entries(self) -> Iterator[AltTextEntry]:
@@ -104,11 +148,10 @@ class SidecarFile(BaseModel):
     @property
     def stats(self) -> dict[str, int]:
         """Count of entries by status."""
+        by_status = Counter(e.status for e in self.images)
         counts: dict[str, int] = {"total": len(self.images)}
         for status in AltTextStatus:
-            counts[status.value] = sum(
-                1 for e in self.images if e.status == status
-            )
+            counts[status.value] = by_status[status]
         return counts
 
 
@@ -132,11 +175,18 @@ class SidecarManager:
         return pdf_path.with_suffix(".alttext.yaml")
 
     @staticmethod
-    def load(path: Path) -> SidecarFile:
-        """Load a sidecar file from disk."""
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
-        if raw is None:
-            raise ValueError(f"Sidecar file is empty: {path}")
+    def load(path: Path, *, trusted: bool = False) -> SidecarFile:
+        """Load a sidecar file from disk.
+
+        Pass ``trusted=True`` only for a file this process just wrote with
+        :meth:`save` (e.g. the pipeline's own sidecar).  It skips pydantic
+        field validation and builds the models directly, which dominates
+        load time on large sidecars.  Hand-edited files must take the
+        default, validating path.
+        """
+        raw = _parse(path.read_text(encoding="utf-8"), path)
+        if trusted:
+            return _construct_trusted(raw)
         return SidecarFile.model_validate(raw)
 
     @staticmethod
@@ -149,12 +199,35 @@ class SidecarManager:
 
         yaml_str = yaml.dump(
             data,
+            Dumper=_Dumper,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
         )
         path.write_text(yaml_str, encoding="utf-8")
 
+    @classmethod
+    def _load_cached(cls, path: Path) -> SidecarFile:
+        """Load *path*, reusing the last YAML parse while its text is unchanged.
+
+        Callers mutate what they get back, so the models are always built
+        fresh from the parsed data rather than shared.
+        """
+        text = path.read_text(encoding="utf-8")
+        key = str(path.resolve())
+        with _load_cache_lock:
+            hit = _load_cache.get(key)
+        if hit is not None and hit[0] == text:
+            raw = hit[1]
+        else:
+            raw = _parse(text, path)
+            with _load_cache_lock:
+                _load_cache.pop(key, None)
+                if len(_load_cache) >= _LOAD_CACHE_MAX:
+                    del _load_cache[next(iter(_load_cache))]
+                _load_cache[key] = (text, raw)
+        return SidecarFile.model_validate(raw)
+
     @classmethod
     def load_or_create(cls, pdf_path: Path) -> tuple[SidecarFile, Path]:
         """Load an existing sidecar or create a new empty one.
@@ -164,7 +237,50 @@ class SidecarManager:
         """
         sidecar_path = cls.sidecar_path_for(pdf_path)
         if sidecar_path.is_file():
-            return cls.load(sidecar_path), sidecar_path
+            return cls._load_cached(sidecar_path), sidecar_path
 
         sidecar = SidecarFile(document=pdf_path.name)
         return sidecar, sidecar_path
+
+
+def group_by_hash(entries: Iterable[AltTextEntry]) -> dict[str, list[AltTextEntry]]:
+    """Group *entries* by image hash, keeping first-seen order.
+
+    A hand-edited sidecar can list one image twice; callers generating alt
+    text use the groups so those entries share one decode and one provider
+    request.
+    """
+    groups: dict[str, list[AltTextEntry]] = {}
+    for entry in entries:
+        groups.setdefault(entry.hash, []).append(entry)
+    return groups
+
+
+def _parse(text: str, path: Path) -> dict:
+    """Parse sidecar YAML *text* read from *path*."""
+    raw = yaml.load(text, Loader=_Loader)
+    if raw is None:
+        raise ValueError(f"Sidecar file is empty: {path}")
+    return raw
+
+
+def _construct_trusted(raw: dict) -> SidecarFile:
+    """Build a SidecarFile from :meth:`SidecarManager.save` output unvalidated.
+
+    Only the two fields ``save`` serializes to a different type are coerced
+    back, so the result matches what ``model_validate`` would return.
+    """
+    images = []
+    for item in raw.get("images") or []:
+        item = dict(item)
+        if "status" in item:
+            item["status"] = AltTextStatus(item["status"])
+        images.append(AltTextEntry.model_construct(**item))
+
+    fields = {"document": raw["document"], "images": images}
+    generated = raw.get("generated")
+    if isinstance(generated, str):
+        generated = datetime.fromisoformat(generated)
+    if generated is not None:
+        fields["generated"] = generated
+    return SidecarFile.model_construct(**fields)
@@ -6,14 +6,22 @@ tags, metadata, and any accessibility issues found.
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import re
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 
 import pikepdf
 
-from accesspdf.processors._pdf_helpers import parse_content_stream_safe
+from accesspdf.processors._pdf_helpers import (
+    FORM_SUBTYPE,
+    IMAGE_SUBTYPE,
+    get_xobjects,
+    iter_form_images,
+    parse_content_stream_safe,
+)
 
 from accesspdf.models import (
     AccessibilityIssue,
@@ -23,6 +31,7 @@ from accesspdf.models import (
     TagInfo,
 )
 from accesspdf.utils.contrast import contrast_ratio, parse_pdf_color
+from accesspdf.utils.hashing import hash_image_stream, prehash_pdf_images
 
 logger = logging.getLogger(__name__)
 
@@ -42,9 +51,44 @@ _AMBIGUOUS_LINK_TEXTS = frozenset({
     "see more",
 })
 
+# Structure element type key; a Name key skips a str -> Name conversion
+# on each of the many membership tests in the tag walk.
+_N_S = pikepdf.Name("/S")
+_N_K = pikepdf.Name("/K")
+_N_TYPE = pikepdf.Name("/Type")
+# Content reference leaves under /K: they point at marked content or an
+# annotation and never carry /S, /Alt or kids of their own.
+_REFERENCE_TYPES = (pikepdf.Name("/MCR"), pikepdf.Name("/OBJR"))
+
+# Pages named in a contrast issue message before "and N more".
+_LISTED_PAGES = 5
+
 _URL_PATTERN = re.compile(r"^https?://\S+$", re.IGNORECASE)
 
 
+def _color_space_name(cs: pikepdf.Object | None) -> str:
+    """Return the family name of an image color space, e.g. ``/ICCBased``.
+
+    Parameterized color spaces are arrays led by their family name; the
+    rest (ICC profile streams, Indexed lookup tables) is not rendered, since
+    converting it to a string is slow and not meaningful in a report.
+    """
+    if cs is None:
+        return ""
+    if isinstance(cs, pikepdf.Array):
+        return str(cs[0]) if len(cs) else ""
+    return str(cs)
+
+
+def _is_struct_node(obj: pikepdf.Object) -> bool:
+    """Return True if *obj* is a /K child the tag walk has to visit."""
+    if not isinstance(obj, pikepdf.Dictionary):
+        return False
+    if _N_S in obj:
+        return True
+    return _N_K in obj and obj.get(_N_TYPE) not in _REFERENCE_TYPES
+
+
 class PDFAnalyzer:
     """Analyzes a PDF file for accessibility compliance.
 
@@ -62,195 +106,314 @@ class PDFAnalyzer:
             result.page_count = len(pdf.pages)
             self._check_metadata(pdf, result)
             self._check_tags(pdf, result)
-            self._extract_images_from_xobjects(pdf, result)
-            self._check_scanned(pdf, result)
-            self._check_contrast(pdf, result)
+            page_xobjects = self._page_xobjects(pdf)
+            # Text-only documents skip the image prehash and its worker pool
+            hash_cache = (
+                prehash_pdf_images(pdf_path, result.page_count)
+                if any(x is not None for x in page_xobjects) else {}
+            )
+            self._scan_pages(pdf, result, hash_cache, page_xobjects)
 
         self._build_issues(result)
 
         return result
 
+    def find_images(self, pdf_path: Path) -> list[ImageInfo]:
+        """Collect the images in *pdf_path* without running the full analysis.
+
+        Returns the same list as ``analyze(pdf_path).images`` -- same hashes,
+        pages and order -- but skips the metadata, tag tree and content
+        stream checks, which callers that only need images would discard.
+        """
+        result = AnalysisResult(source_path=pdf_path)
+
+        with pikepdf.open(pdf_path) as pdf:
+            page_xobjects = self._page_xobjects(pdf)
+            if all(x is None for x in page_xobjects):
+                return []
+            hash_cache = prehash_pdf_images(pdf_path, len(page_xobjects))
+            seen_hashes: set[str] = set()
+            visited: set[tuple[int, int]] = set()
+            for page_num, xobjects in enumerate(page_xobjects, start=1):
+                if xobjects is None:
+                    continue
+                try:
+                    self._scan_page_xobjects(
+                        xobjects, page_num, seen_hashes, result, hash_cache, visited
+                    )
+                except Exception:
+                    logger.warning(
+                        "Image extraction failed on page %d", page_num, exc_info=True
+                    )
+
+        return result.images
+
     def _check_metadata(self, pdf: pikepdf.Pdf, result: AnalysisResult) -> None:
         """Inspect document metadata for title and language."""
         # Check for document title
-        if pdf.docinfo and "/Title" in pdf.docinfo:
-            title = str(pdf.docinfo["/Title"])
-            if title.strip():
-                result.title = title.strip()
+        info = pdf.docinfo
+        title = info.get("/Title") if info else None
+        if title is not None:
+            title = str(title).strip()
+            if title:
+                result.title = title
 
         # Check for language
-        if pdf.Root and "/Lang" in pdf.Root:
+        root = pdf.Root
+        lang = root.get("/Lang") if root else None
+        if lang is not None:
             result.has_lang = True
-            result.detected_lang = str(pdf.Root["/Lang"])
+            result.detected_lang = str(lang)
 
     def _check_tags(self, pdf: pikepdf.Pdf, result: AnalysisResult) -> None:
         """Check whether the PDF has a tag structure."""
-        if "/MarkInfo" in pdf.Root:
-            mark_info = pdf.Root["/MarkInfo"]
-            if "/Marked" in mark_info and bool(mark_info["/Marked"]):
-                result.is_tagged = True
+        root = pdf.Root
+        mark_info = root.get("/MarkInfo")
+        if mark_info is not None and bool(mark_info.get("/Marked", False)):
+            result.is_tagged = True
 
-        if "/StructTreeRoot" not in pdf.Root:
+        struct_root = root.get("/StructTreeRoot")
+        if struct_root is None:
             return
 
-        struct_root = pdf.Root["/StructTreeRoot"]
         self._walk_struct_tree(struct_root, result)
 
     def _walk_struct_tree(self, node: pikepdf.Object, result: AnalysisResult) -> None:
-        """Recursively walk the structure tree and collect TagInfo."""
-        try:
-            if "/S" in node:
-                tag_type = str(node["/S"])[1:]  # strip leading /
-                tag = TagInfo(tag_type=tag_type)
-
-                if "/Alt" in node:
-                    tag.has_alt_text = True
-                    tag.alt_text = str(node["/Alt"])
-
-                result.tags.append(tag)
-
-            if "/K" in node:
-                kids = node["/K"]
-                if isinstance(kids, pikepdf.Array):
-                    for child in kids:
-                        if isinstance(child, pikepdf.Dictionary):
-                            self._walk_struct_tree(child, result)
-                elif isinstance(kids, pikepdf.Dictionary):
-                    self._walk_struct_tree(kids, result)
-        except Exception:
-            logger.debug("Error walking struct tree node", exc_info=True)
-
-    def _extract_images_from_xobjects(
-        self, pdf: pikepdf.Pdf, result: AnalysisResult
-    ) -> None:
-        """Extract all image XObjects from the PDF, deduplicating by hash."""
-        seen_hashes: set[str] = set()
-        try:
-            for page_idx, page in enumerate(pdf.pages, start=1):
-                self._scan_page_xobjects(page, page_idx, seen_hashes, result)
-        except Exception:
-            logger.warning("Image extraction failed", exc_info=True)
-            result.issues.append(
-                AccessibilityIssue(
-                    rule="image-extraction",
-                    severity=Severity.WARNING,
-                    message="Failed to extract images from PDF.",
-                )
-            )
+        """Walk the structure tree in document order and collect TagInfo.
+
+        Uses an explicit stack so deeply nested tag trees can't hit the
+        recursion limit, and skips elements already visited so a malformed
+        tree with a /K cycle terminates.
+        """
+        stack = [node]
+        seen: set[tuple[int, int]] = set()
+        # Raw /S value -> interned name without the slash.  Tag trees reuse a
+        # few dozen standard types, so each is sliced once per document.
+        tag_names: dict[str, str] = {}
+        while stack:
+            node = stack.pop()
+            try:
+                objgen = node.objgen
+                if objgen != (0, 0):
+                    if objgen in seen:
+                        continue
+                    seen.add(objgen)
+
+                type_name = node.get("/S")
+                if type_name is not None:
+                    raw_type = str(type_name)
+                    tag_type = tag_names.get(raw_type)
+                    if tag_type is None:
+                        tag_type = tag_names[raw_type] = sys.intern(raw_type[1:])
+                    tag = TagInfo(tag_type=tag_type)
+
+                    alt = node.get("/Alt")
+                    if alt is not None:
+                        tag.has_alt_text = True
+                        tag.alt_text = str(alt)
+
+                    result.tags.append(tag)
+
+                # MCID integers and /MCR or /OBJR reference dicts are leaves
+                # with nothing to collect, and often the bulk of a tag tree,
+                # so they are never pushed.  Dicts without /S are still
+                # walked when they have /K, since their kids can be tags.
+                kids = node.get("/K")
+                if kids is not None:
+                    if isinstance(kids, pikepdf.Array):
+                        stack.extend(
+                            child for child in reversed(kids) if _is_struct_node(child)
+                        )
+                    elif _is_struct_node(kids):
+                        stack.append(kids)
+            except Exception:
+                logger.debug("Error walking struct tree node", exc_info=True)
+
+    def _page_xobjects(self, pdf: pikepdf.Pdf) -> list[pikepdf.Dictionary | None]:
+        """Return each page's /XObject resource dictionary, or None if absent.
+
+        Resolved once up front so the prehash decision and the page walk
+        don't both look up /Resources on every page.
+        """
+        return [get_xobjects(page) for page in pdf.pages]
 
     def _scan_page_xobjects(
         self,
-        page: pikepdf.Page,
+        xobjects: pikepdf.Dictionary,
         page_num: int,
         seen_hashes: set[str],
         result: AnalysisResult,
-    ) -> None:
-        """Scan a single page for image XObjects."""
-        if "/Resources" not in page or "/XObject" not in page["/Resources"]:
-            return
-
-        for _name, xobj_ref in page["/Resources"]["/XObject"].items():
+        hash_cache: dict[tuple[int, int], str] | None = None,
+        visited: set[tuple[int, int]] | None = None,
+    ) -> bool:
+        """Record the images in a page's *xobjects*, including inside Forms.
+
+        Images are deduplicated by hash across the document.  Returns True
+        if the page draws an Image XObject directly (duplicate or not),
+        which is what the scanned-page check counts as an image page.
+        """
+        has_image = False
+        images: Iterable[pikepdf.Stream]
+        for xobj in xobjects.values():
             try:
-                xobj = xobj_ref.resolve() if hasattr(xobj_ref, "resolve") else xobj_ref
                 if not isinstance(xobj, pikepdf.Stream):
                     continue
 
-                # Skip form XObjects that aren't images — check /Subtype
-                subtype = str(xobj.get("/Subtype", ""))
-                if subtype == "/Form":
-                    # Form XObjects can contain images; recurse into them
-                    self._scan_form_xobject(xobj, page_num, seen_hashes, result)
-                    continue
-                if subtype != "/Image":
+                # Form XObjects can contain images at any nesting depth
+                subtype = xobj.get("/Subtype")
+                if subtype == IMAGE_SUBTYPE:
+                    has_image = True
+                    images = (xobj,)
+                elif subtype == FORM_SUBTYPE and (
+                    visited is None or xobj.objgen not in visited
+                ):
+                    images = iter_form_images(xobj, visited)
+                else:
                     continue
 
-                raw = bytes(xobj.read_raw_bytes())
-                img_hash = hashlib.md5(raw).hexdigest()
-
-                if img_hash in seen_hashes:
-                    continue
-                seen_hashes.add(img_hash)
-
-                w = int(xobj.get("/Width", 0))
-                h = int(xobj.get("/Height", 0))
-                cs = str(xobj.get("/ColorSpace", ""))
-
-                result.images.append(
-                    ImageInfo(
-                        image_hash=img_hash,
-                        page=page_num,
-                        width=w,
-                        height=h,
-                        color_space=cs,
+                for image in images:
+                    img_hash = hash_image_stream(image, hash_cache)
+                    if img_hash in seen_hashes:
+                        continue
+                    seen_hashes.add(img_hash)
+
+                    result.images.append(
+                        ImageInfo(
+                            image_hash=img_hash,
+                            page=page_num,
+                            width=int(image.get("/Width", 0)),
+                            height=int(image.get("/Height", 0)),
+                            color_space=_color_space_name(image.get("/ColorSpace")),
+                        )
                     )
-                )
             except Exception:
                 logger.debug("Could not process XObject on page %d", page_num, exc_info=True)
+        return has_image
+
+    # ------------------------------------------------------------------
+    # Page walk
+    # ------------------------------------------------------------------
 
-    def _scan_form_xobject(
+    def _scan_pages(
         self,
-        form_xobj: pikepdf.Stream,
-        page_num: int,
-        seen_hashes: set[str],
+        pdf: pikepdf.Pdf,
         result: AnalysisResult,
+        hash_cache: dict[tuple[int, int], str] | None = None,
+        page_xobjects: list[pikepdf.Dictionary | None] | None = None,
     ) -> None:
-        """Recurse into a Form XObject to find embedded images."""
-        try:
-            resources = form_xobj.get("/Resources")
-            if resources is None or "/XObject" not in resources:
-                return
-            for _name, inner_ref in resources["/XObject"].items():
-                inner = inner_ref.resolve() if hasattr(inner_ref, "resolve") else inner_ref
-                if not isinstance(inner, pikepdf.Stream):
-                    continue
-                subtype = str(inner.get("/Subtype", ""))
-                if subtype != "/Image":
-                    continue
+        """Collect images and run the scanned-PDF and contrast checks.
+
+        All three work page by page, so they share one walk: each page's
+        /XObject dictionary is resolved once for the image scan and the
+        image-page test, and its content stream is parsed once for the text
+        and contrast checks, which also share one pass over its operators.
+        Image digests are memoized by object id and
+        each Form XObject is expanded once per document; *hash_cache* may be
+        pre-seeded, e.g. by ``prehash_pdf_images``, and *page_xobjects* may
+        carry the per-page dictionaries from ``_page_xobjects``.
+        """
+        seen_hashes: set[str] = set()
+        if hash_cache is None:
+            hash_cache = {}
+        visited: set[tuple[int, int]] = set()
+        image_scan_failed = False
+        image_only_pages = 0
+        # Issue messages list only the first few pages, so only those are
+        # kept; the rest are just counted.
+        low_contrast_pages: list[int] = []
+        very_low_contrast_pages: list[int] = []
+        low_contrast_count = 0
+        very_low_contrast_count = 0
 
-                raw = bytes(inner.read_raw_bytes())
-                img_hash = hashlib.md5(raw).hexdigest()
-                if img_hash in seen_hashes:
-                    continue
-                seen_hashes.add(img_hash)
-
-                w = int(inner.get("/Width", 0))
-                h = int(inner.get("/Height", 0))
-                cs = str(inner.get("/ColorSpace", ""))
-
-                result.images.append(
-                    ImageInfo(
-                        image_hash=img_hash,
-                        page=page_num,
-                        width=w,
-                        height=h,
-                        color_space=cs,
+        for page_num, page in enumerate(pdf.pages, start=1):
+            has_image = False
+            try:
+                xobjects = (
+                    page_xobjects[page_num - 1]
+                    if page_xobjects is not None
+                    else get_xobjects(page)
+                )
+                if xobjects is not None:
+                    has_image = self._scan_page_xobjects(
+                        xobjects, page_num, seen_hashes, result, hash_cache, visited
                     )
+            except Exception:
+                logger.warning("Image extraction failed on page %d", page_num, exc_info=True)
+                image_scan_failed = True
+
+            ops = parse_content_stream_safe(page, page_num - 1)
+
+            has_text, colors = self._scan_text_ops(ops)
+            # Drop the parsed ops before the next page is parsed, so only
+            # one page's operand lists are alive at a time.
+            ops = None
+
+            if has_image and not has_text:
+                image_only_pages += 1
+
+            try:
+                for color in colors:
+                    ratio = contrast_ratio(color, WHITE)
+                    if ratio < 3.0:
+                        if very_low_contrast_count < _LISTED_PAGES:
+                            very_low_contrast_pages.append(page_num)
+                        very_low_contrast_count += 1
+                        break
+                    elif ratio < 4.5:
+                        if low_contrast_count < _LISTED_PAGES:
+                            low_contrast_pages.append(page_num)
+                        low_contrast_count += 1
+                        break
+            except Exception:
+                logger.debug(
+                    "Could not check contrast on page %d", page_num, exc_info=True
                 )
-        except Exception:
-            logger.debug("Could not scan form XObject on page %d", page_num, exc_info=True)
+
+        if image_scan_failed:
+            result.issues.append(
+                AccessibilityIssue(
+                    rule="image-extraction",
+                    severity=Severity.WARNING,
+                    message="Failed to extract images from PDF.",
+                )
+            )
+        self._check_scanned(image_only_pages, result)
+        # A scanned PDF needs OCR first; contrast findings on its few text
+        # pages would only be noise next to that.
+        if not result.is_scanned:
+            self._check_contrast(
+                low_contrast_pages, low_contrast_count,
+                very_low_contrast_pages, very_low_contrast_count,
+                result,
+            )
 
     # ------------------------------------------------------------------
     # Scanned PDF detection
     # ------------------------------------------------------------------
 
-    _TEXT_OPERATORS = frozenset({"Tj", "TJ", "'", '"'})
-
-    def _check_scanned(self, pdf: pikepdf.Pdf, result: AnalysisResult) -> None:
+    # Operators are hashed and compared as-is, so the per-op test below does
+    # not build a str for every operator in the page.
+    _TEXT_OPERATORS = frozenset(pikepdf.Operator(op) for op in ("Tj", "TJ", "'", '"'))
+    # Fill color operator -> (operand count, color space for parse_pdf_color)
+    _FILL_COLOR_OPERATORS = {
+        pikepdf.Operator("rg"): (3, "rgb"),
+        pikepdf.Operator("g"): (1, "gray"),
+        pikepdf.Operator("k"): (4, "cmyk"),
+    }
+    # Every operator _scan_text_ops reacts to, mapped to its role.  Most
+    # operators in a page are none of these and cost one dict lookup.
+    _OPERATOR_ROLES = {
+        pikepdf.Operator("BT"): "begin",
+        pikepdf.Operator("ET"): "end",
+        **dict.fromkeys(_TEXT_OPERATORS, "show"),
+        **dict.fromkeys(_FILL_COLOR_OPERATORS, "fill"),
+    }
+
+    def _check_scanned(self, image_only_pages: int, result: AnalysisResult) -> None:
         """Detect scanned (image-only) PDFs that lack a text layer."""
         if result.page_count == 0:
             return
 
-        image_only_pages = 0
-
-        for page in pdf.pages:
-            try:
-                has_image = self._page_has_image(page)
-                has_text = self._page_has_text(page)
-                if has_image and not has_text:
-                    image_only_pages += 1
-            except Exception:
-                logger.debug("Could not check page for scanned content", exc_info=True)
-
         ratio = image_only_pages / result.page_count
         if ratio >= 0.9 and image_only_pages >= 1:
             result.is_scanned = True
@@ -266,61 +429,28 @@ class PDFAnalyzer:
                 )
             )
 
-    def _page_has_image(self, page: pikepdf.Page) -> bool:
-        """Return True if the page has at least one Image XObject."""
-        if "/Resources" not in page or "/XObject" not in page["/Resources"]:
-            return False
-        for _name, xobj_ref in page["/Resources"]["/XObject"].items():
-            try:
-                xobj = xobj_ref.resolve() if hasattr(xobj_ref, "resolve") else xobj_ref
-                if isinstance(xobj, pikepdf.Stream):
-                    subtype = str(xobj.get("/Subtype", ""))
-                    if subtype == "/Image":
-                        return True
-            except Exception:
-                pass
-        return False
-
-    def _page_has_text(self, page: pikepdf.Page) -> bool:
-        """Return True if the page's content stream has text-rendering operators."""
-        ops = parse_content_stream_safe(page)
-        if ops is None:
-            return False
-        for _operands, operator in ops:
-            if str(operator) in self._TEXT_OPERATORS:
-                return True
-        return False
-
     # ------------------------------------------------------------------
     # Contrast checking (WCAG 1.4.3)
     # ------------------------------------------------------------------
 
-    def _check_contrast(self, pdf: pikepdf.Pdf, result: AnalysisResult) -> None:
-        """Extract text colors from content streams and flag low contrast."""
-        low_contrast_pages: list[int] = []
-        very_low_contrast_pages: list[int] = []
-
-        for page_num, page in enumerate(pdf.pages, start=1):
-            try:
-                colors = self._extract_text_colors(page)
-                for color in colors:
-                    ratio = contrast_ratio(color, WHITE)
-                    if ratio < 3.0:
-                        very_low_contrast_pages.append(page_num)
-                        break
-                    elif ratio < 4.5:
-                        low_contrast_pages.append(page_num)
-                        break
-            except Exception:
-                logger.debug(
-                    "Could not check contrast on page %d", page_num, exc_info=True
-                )
+    def _check_contrast(
+        self,
+        low_contrast_pages: list[int],
+        low_contrast_count: int,
+        very_low_contrast_pages: list[int],
+        very_low_contrast_count: int,
+        result: AnalysisResult,
+    ) -> None:
+        """Flag pages whose text colors have low contrast against white.
 
-        if very_low_contrast_pages:
-            pages_str = ", ".join(str(p) for p in very_low_contrast_pages[:5])
+        Each ``*_pages`` list holds the first pages found, and the matching
+        count the total number of pages.
+        """
+        if very_low_contrast_count:
+            pages_str = ", ".join(str(p) for p in very_low_contrast_pages)
             suffix = (
-                f" and {len(very_low_contrast_pages) - 5} more"
-                if len(very_low_contrast_pages) > 5
+                f" and {very_low_contrast_count - len(very_low_contrast_pages)} more"
+                if very_low_contrast_count > len(very_low_contrast_pages)
                 else ""
             )
             result.issues.append(
@@ -334,11 +464,11 @@ class PDFAnalyzer:
                 )
             )
 
-        if low_contrast_pages:
-            pages_str = ", ".join(str(p) for p in low_contrast_pages[:5])
+        if low_contrast_count:
+            pages_str = ", ".join(str(p) for p in low_contrast_pages)
             suffix = (
-                f" and {len(low_contrast_pages) - 5} more"
-                if len(low_contrast_pages) > 5
+                f" and {low_contrast_count - len(low_contrast_pages)} more"
+                if low_contrast_count > len(low_contrast_pages)
                 else ""
             )
             result.issues.append(
@@ -352,47 +482,72 @@ class PDFAnalyzer:
                 )
             )
 
-    def _extract_text_colors(self, page: pikepdf.Page) -> list[tuple[int, int, int]]:
-        """Parse content stream operators to find text fill colors."""
-        ops = parse_content_stream_safe(page)
+    def _scan_text_ops(
+        self, ops: list | None
+    ) -> tuple[bool, list[tuple[int, int, int]]]:
+        """Scan parsed content stream *ops* for text in one pass.
+
+        Returns whether the page shows any text, and the distinct fill colors
+        in effect when text is shown inside BT/ET blocks, in first-seen order.
+        A malformed fill color operand empties the color list, since the
+        colors in effect are unknown from there on, but the text check runs
+        to the end.
+        """
         if ops is None:
-            return []
+            return False, []
 
+        roles = self._OPERATOR_ROLES
+        fill_ops = self._FILL_COLOR_OPERATORS
+        has_text = False
         colors: list[tuple[int, int, int]] = []
         current_fill: tuple[int, int, int] = (0, 0, 0)  # default: black
         seen: set[tuple[int, int, int]] = set()
         in_text = False
-
-        for operands, operator in ops:
-            op = str(operator)
-
-            # Track text blocks
-            if op == "BT":
-                in_text = True
-            elif op == "ET":
-                in_text = False
-
-            # Non-stroking (fill) color operators
-            elif op == "rg" and len(operands) >= 3:
-                current_fill = parse_pdf_color(
-                    [float(o) for o in operands[:3]], "rgb"
-                )
-            elif op == "g" and len(operands) >= 1:
-                current_fill = parse_pdf_color(
-                    [float(operands[0])], "gray"
-                )
-            elif op == "k" and len(operands) >= 4:
-                current_fill = parse_pdf_color(
-                    [float(o) for o in operands[:4]], "cmyk"
-                )
+        scan_colors = True
+        # Pages set the same few fill colors over and over, so each distinct
+        # operand tuple is converted to RGB once.  Keys are floats: hashing the
+        # Decimal operands pikepdf returns is slower than converting them.
+        fill_cache: dict[tuple, tuple[int, int, int]] = {}
+
+        # Unpacking an instruction converts its operands to Python objects,
+        # which costs far more than the operator test itself; operands are
+        # only read for the fill color operators.
+        for instruction in ops:
+            operator = instruction.operator
+            role = roles.get(operator)
+            if role is None:
+                continue
 
             # Text-showing operators: Tj, TJ, ', "
-            elif op in ("Tj", "TJ", "'", '"') and in_text:
-                if current_fill not in seen:
+            if role == "show":
+                has_text = True
+                if in_text and scan_colors and current_fill not in seen:
                     seen.add(current_fill)
                     colors.append(current_fill)
 
-        return colors
+            # Non-stroking (fill) color operators: rg, g, k
+            elif role == "fill":
+                if not scan_colors:
+                    continue
+                arity, space = fill_ops[operator]
+                try:
+                    values = tuple(map(float, instruction.operands[:arity]))
+                    if len(values) == arity:
+                        key = (space, values)
+                        fill = fill_cache.get(key)
+                        if fill is None:
+                            fill = fill_cache[key] = parse_pdf_color(list(values), space)
+                        current_fill = fill
+                except Exception:
+                    logger.debug("Could not parse fill color", exc_info=True)
+                    scan_colors = False
+                    colors = []
+
+            # Track text blocks
+            else:
+                in_text = role == "begin"
+
+        return has_text, colors
 
     # ------------------------------------------------------------------
     # Issue building
@@ -427,28 +582,33 @@ class PDFAnalyzer:
                 )
             )
 
+        # Bucket tags by type once; the checks below each need one or two types
+        tags_by_type: dict[str, list[TagInfo]] = defaultdict(list)
+        for tag in result.tags:
+            tags_by_type[tag.tag_type].append(tag)
+
         # Check for images without alt text
-        figure_tags = [t for t in result.tags if t.tag_type == "Figure"]
-        images_without_alt = [t for t in figure_tags if not t.has_alt_text]
+        images_without_alt = sum(
+            1 for t in tags_by_type.get("Figure", ()) if not t.has_alt_text
+        )
         if images_without_alt:
             result.issues.append(
                 AccessibilityIssue(
                     rule="image-alt-text",
                     severity=Severity.ERROR,
-                    message=f"{len(images_without_alt)} image(s) missing alt text.",
+                    message=f"{images_without_alt} image(s) missing alt text.",
                 )
             )
 
-        self._check_links(result)
-        self._check_tables(result)
+        self._check_links(result, tags_by_type.get("Link", []))
+        self._check_tables(result, tags_by_type)
 
     # ------------------------------------------------------------------
     # Link validation (WCAG 2.4.4)
     # ------------------------------------------------------------------
 
-    def _check_links(self, result: AnalysisResult) -> None:
+    def _check_links(self, result: AnalysisResult, link_tags: list[TagInfo]) -> None:
         """Check link tags for ambiguous, bare-URL, or empty link text."""
-        link_tags = [t for t in result.tags if t.tag_type == "Link"]
         if not link_tags:
             return
 
@@ -456,14 +616,16 @@ class PDFAnalyzer:
         bare_url_count = 0
         empty_count = 0
 
-        for tag in link_tags:
-            text = tag.alt_text.strip()
+        # Link text repeats a lot (tables of contents, "here" in every
+        # paragraph), so each distinct text is classified once.
+        for raw_text, count in Counter(tag.alt_text for tag in link_tags).items():
+            text = raw_text.strip()
             if not text or text == "Link":
-                empty_count += 1
+                empty_count += count
             elif text.lower() in _AMBIGUOUS_LINK_TEXTS:
-                ambiguous_count += 1
+                ambiguous_count += count
             elif _URL_PATTERN.match(text):
-                bare_url_count += 1
+                bare_url_count += count
 
         if empty_count:
             result.issues.append(
@@ -499,10 +661,12 @@ class PDFAnalyzer:
     # Table validation
     # ------------------------------------------------------------------
 
-    def _check_tables(self, result: AnalysisResult) -> None:
+    def _check_tables(
+        self, result: AnalysisResult, tags_by_type: dict[str, list[TagInfo]]
+    ) -> None:
         """Check table structure for headers and scope attributes."""
-        table_tags = [t for t in result.tags if t.tag_type == "Table"]
-        th_tags = [t for t in result.tags if t.tag_type == "TH"]
+        table_tags = tags_by_type.get("Table", [])
+        th_tags = tags_by_type.get("TH", [])
 
         if table_tags and not th_tags:
             result.issues.append(
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from accesspdf import __version__
 
@@ -18,6 +19,24 @@ def _clean_title(name: str) -> str:
     return name
 
 
+def _iter_pdfs(root: Path, recursive: bool) -> Iterator[Path]:
+    """Yield the ``*.pdf`` files (any case) in *root*, and below it if *recursive*.
+
+    Uses ``os.scandir`` so file and directory checks come from the directory
+    entries themselves instead of a ``stat`` per path.  Directory symlinks are
+    not followed, which also keeps a link loop from recursing forever.
+    """
+    with os.scandir(root) as entries:
+        subdirs = []
+        for entry in entries:
+            if entry.name.lower().endswith(".pdf") and entry.is_file():
+                yield Path(entry.path)
+            elif recursive and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+    for subdir in subdirs:
+        yield from _iter_pdfs(Path(subdir), recursive)
+
+
 app = typer.Typer(
     name="accesspdf",
     help="PDF accessibility remediation tool.",
@@ -47,7 +66,10 @@ def check(
     pdf: Path = typer.Argument(..., help="Path to the PDF file to analyze."),
 ) -> None:
     """Analyze a PDF for accessibility issues (no modification)."""
+    from collections import Counter
+
     from accesspdf.analyzer import PDFAnalyzer
+    from rich.table import Table
 
     if not pdf.is_file():
         console.print(f"[red]File not found:[/red] {pdf}")
@@ -56,9 +78,10 @@ def check(
     analyzer = PDFAnalyzer()
     result = analyzer.analyze(pdf)
 
-    # Count tags by type for summary
-    link_count = sum(1 for t in result.tags if t.tag_type == "Link")
-    table_count = sum(1 for t in result.tags if t.tag_type == "Table")
+    # Count tags by type for summary, in one pass over the tag list
+    tag_counts = Counter(t.tag_type for t in result.tags)
+    link_count = tag_counts["Link"]
+    table_count = tag_counts["Table"]
     contrast_issues = [i for i in result.issues if i.rule.startswith("contrast-")]
 
     table = Table(title=f"Accessibility Report: {pdf.name}")
@@ -197,6 +220,10 @@ def batch(
         None, "--alt-text-dir", help="Directory with .alttext.yaml sidecar files to inject.",
     ),
     recursive: bool = typer.Option(False, "--recursive", "-r", help="Search subdirectories."),
+    jobs: Optional[int] = typer.Option(  # noqa: UP007
+        None, "--jobs", "-j", min=1,
+        help="PDFs to fix in parallel. Defaults to the number of CPUs.",
+    ),
 ) -> None:
     """Fix all PDFs in a directory at once."""
     if not directory.is_dir():
@@ -204,9 +231,7 @@ def batch(
         raise typer.Exit(code=1)
 
     # Collect PDF files
-    pattern = "**/*.pdf" if recursive else "*.pdf"
-    pdf_files = sorted(directory.glob(pattern))
-    pdf_files = [p for p in pdf_files if p.is_file()]
+    pdf_files = sorted(_iter_pdfs(directory, recursive))
 
     if not pdf_files:
         console.print(f"[dim]No PDF files found in {directory}[/dim]")
@@ -217,35 +242,75 @@ def batch(
         output_dir = directory / "accessible"
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    from accesspdf.models import BatchResult
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    from accesspdf.models import BatchResult, RemediationResult
     from accesspdf.pipeline import run_pipeline
+    from accesspdf.utils.hashing import limit_prehash_workers
     from rich.progress import Progress
+    from rich.table import Table
 
     batch_result = BatchResult()
 
     console.print(f"[dim]Processing {len(pdf_files)} PDF(s) from {directory}[/dim]")
     console.print(f"[dim]Output to: {output_dir}[/dim]")
 
-    with Progress(console=console) as progress:
-        task = progress.add_task("Fixing PDFs...", total=len(pdf_files))
-
-        for pdf_path in pdf_files:
-            out_path = output_dir / f"{pdf_path.stem}_accessible.pdf"
+    # Look for matching sidecars if alt_text_dir provided
+    work: list[tuple[Path, Path, Path | None]] = []
+    for pdf_path in pdf_files:
+        out_path = output_dir / f"{pdf_path.stem}_accessible.pdf"
+        sidecar_path = None
+        if alt_text_dir:
+            candidate = alt_text_dir / f"{pdf_path.stem}.alttext.yaml"
+            if candidate.is_file():
+                sidecar_path = candidate
+        work.append((pdf_path, out_path, sidecar_path))
+
+    workers = min(jobs or os.cpu_count() or 1, len(work))
+    # Outcomes are slotted by input position so the summary lists files in
+    # the same order however the workers finish.
+    outcomes: list[RemediationResult | str | None] = [None] * len(work)
 
-            # Look for matching sidecar if alt_text_dir provided
-            sidecar_path = None
-            if alt_text_dir:
-                candidate = alt_text_dir / f"{pdf_path.stem}.alttext.yaml"
-                if candidate.is_file():
-                    sidecar_path = candidate
-
-            try:
-                result = run_pipeline(pdf_path, out_path, alt_text_sidecar=sidecar_path)
-                batch_result.results.append(result)
-            except Exception as exc:
-                batch_result.failed.append((pdf_path, str(exc)))
+    with Progress(console=console) as progress:
+        task = progress.add_task("Fixing PDFs...", total=len(work))
 
-            progress.advance(task)
+        if workers <= 1:
+            for i, (pdf_path, out_path, sidecar_path) in enumerate(work):
+                try:
+                    outcomes[i] = run_pipeline(
+                        pdf_path, out_path, alt_text_sidecar=sidecar_path
+                    )
+                except Exception as exc:
+                    outcomes[i] = str(exc)
+                progress.advance(task)
+        else:
+            # Each PDF is fixed in its own process: the pipeline is mostly
+            # pure Python, so threads would serialize on the GIL.  The
+            # processes already fill the CPUs, so each one hashes serially.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=limit_prehash_workers,
+                initargs=(1,),
+            ) as pool:
+                futures = {
+                    pool.submit(
+                        run_pipeline, pdf_path, out_path, alt_text_sidecar=sidecar_path
+                    ): i
+                    for i, (pdf_path, out_path, sidecar_path) in enumerate(work)
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        outcomes[i] = future.result()
+                    except Exception as exc:
+                        outcomes[i] = str(exc)
+                    progress.advance(task)
+
+    for (pdf_path, _out_path, _sidecar_path), outcome in zip(work, outcomes, strict=True):
+        if isinstance(outcome, str):
+            batch_result.failed.append((pdf_path, outcome))
+        elif outcome is not None:
+            batch_result.results.append(outcome)
 
     # Summary table
     table = Table(title="Batch Results")
@@ -299,6 +364,7 @@ def generate_alt_text(
     model: Optional[str] = typer.Option(None, "--model", "-m", help="Model override."),  # noqa: UP007
     api_key: Optional[str] = typer.Option(None, "--api-key", help="API key (or set env var)."),  # noqa: UP007
     doc_context: Optional[str] = typer.Option(None, "--context", "-c", help="Document context to improve AI accuracy (e.g., 'chemistry textbook')."),  # noqa: UP007
+    jobs: int = typer.Option(4, "--jobs", "-j", min=1, help="Images to describe at once. Rate-limited providers still pace their own requests."),
 ) -> None:
     """Generate AI alt text drafts for images in a PDF."""
     import asyncio
@@ -307,7 +373,7 @@ def generate_alt_text(
         console.print(f"[red]File not found:[/red] {pdf}")
         raise typer.Exit(code=1)
 
-    from accesspdf.alttext.sidecar import SidecarManager
+    from accesspdf.alttext.sidecar import SidecarManager, group_by_hash
 
     sidecar, sidecar_path = SidecarManager.load_or_create(pdf)
 
@@ -357,52 +423,67 @@ def generate_alt_text(
     console.print(f"[dim]Generating drafts for {len(pending)} image(s)...[/dim]")
 
     # Generate
-    from accesspdf.alttext.extract import extract_image, prepare_for_ai
+    from accesspdf.alttext.extract import LazyImage, extract_all_images, prepare_for_ai
     from accesspdf.providers.base import ImageContext
     from rich.progress import Progress
 
-    _CLI_CONCURRENT = 1  # Sequential — provider throttle handles pacing
+    images = {h: lazy for h, _page, lazy in extract_all_images(pdf)}
+
+    by_hash = group_by_hash(pending)
+
+    def _prepare(lazy: LazyImage | None) -> bytes | None:
+        img = lazy() if lazy is not None else None
+        return prepare_for_ai(img) if img is not None else None
 
     async def _generate_all() -> int:
         count = 0
-        sem = asyncio.Semaphore(_CLI_CONCURRENT)
+        # Requests overlap up to --jobs; Gemini's throttle still spaces its
+        # own calls, so the free tier's rate limit holds.
+        sem = asyncio.Semaphore(jobs)
 
         with Progress(console=console) as progress:
             task = progress.add_task("Generating...", total=len(pending))
 
-            async def _one(entry: object) -> bool:
+            async def _one(entries: list) -> int:
+                entry = entries[0]
                 try:
-                    img = extract_image(pdf, entry.hash)
-                    if img is None:
-                        progress.advance(task)
-                        return False
-
-                    context = ImageContext(
-                        image_bytes=prepare_for_ai(img),
-                        page=entry.page,
-                        caption=entry.caption,
-                        surrounding_text=entry.context,
-                        document_title=_clean_title(sidecar.document),
-                        document_context=doc_context or "",
-                    )
-
                     async with sem:
+                        # Decoding and downscaling block, so they run on a
+                        # thread while other requests are in flight.  Holding
+                        # the semaphore first keeps at most --jobs images
+                        # in memory.
+                        image_bytes = await asyncio.to_thread(
+                            _prepare, images.pop(entry.hash, None)
+                        )
+                        if image_bytes is None:
+                            progress.advance(task, len(entries))
+                            return 0
+
+                        context = ImageContext(
+                            image_bytes=image_bytes,
+                            page=entry.page,
+                            caption=entry.caption,
+                            surrounding_text=entry.context,
+                            document_title=_clean_title(sidecar.document),
+                            document_context=doc_context or "",
+                        )
                         result = await prov.generate(context)
 
                     if result.alt_text:
-                        entry.ai_draft = result.alt_text
-                        progress.advance(task)
-                        return True
+                        for e in entries:
+                            e.ai_draft = result.alt_text
+                        progress.advance(task, len(entries))
+                        return len(entries)
                     elif result.error:
                         console.print(f"  [yellow]![/yellow] {entry.id}: {result.error}")
                 except Exception as exc:
                     console.print(f"  [yellow]![/yellow] {entry.id}: {exc}")
 
-                progress.advance(task)
-                return False
+                progress.advance(task, len(entries))
+                return 0
 
-            results = await asyncio.gather(*[_one(e) for e in pending])
-            count = sum(1 for r in results if r)
+            results = await asyncio.gather(*[_one(g) for g in by_hash.values()])
+            count = sum(results)
         return count
 
     generated = asyncio.run(_generate_all())
@@ -416,6 +497,7 @@ def generate_alt_text(
 def providers() -> None:
     """Show available AI providers and their status."""
     from accesspdf.providers import list_available
+    from rich.table import Table
 
     results = list_available()
 
@@ -23,7 +23,7 @@ class AltTextStatus(str, enum.Enum):
     DECORATIVE = "decorative"
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessibilityIssue:
     """A single accessibility issue found during analysis."""
 
@@ -34,7 +34,7 @@ class AccessibilityIssue:
     element: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageInfo:
     """Information about a single image extracted from a PDF."""
 
@@ -53,7 +53,7 @@ class ImageInfo:
         return self.image_hash[:6]
 
 
-@dataclass
+@dataclass(slots=True)
 class TagInfo:
     """Structural tag information from the PDF tag tree."""
 
@@ -63,7 +63,7 @@ class TagInfo:
     alt_text: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete result of analyzing a PDF for accessibility issues."""
 
@@ -87,7 +87,7 @@ class AnalysisResult:
         return sum(1 for i in self.issues if i.severity == Severity.WARNING)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessorResult:
     """Result from a single remediation processor."""
 
@@ -98,7 +98,7 @@ class ProcessorResult:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RemediationResult:
     """Aggregate result from the full remediation pipeline."""
 
@@ -125,7 +125,7 @@ class RemediationResult:
         return out
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchResult:
     """Aggregate result from processing a batch of PDFs."""
 
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import logging
-import shutil
 from pathlib import Path
 
 import pikepdf
@@ -33,8 +32,8 @@ def run_pipeline(
 ) -> RemediationResult:
     """Run the full remediation pipeline on a PDF.
 
-    1. Copies input to output (never modifies the original).
-    2. Runs each registered processor in order.
+    1. Opens the input read-only (never modifies the original).
+    2. Runs each registered processor in order and saves to *output_path*.
     3. Optionally injects approved alt text from a sidecar file.
     """
     # Ensure all processors are registered (lazy to avoid circular imports)
@@ -46,11 +45,13 @@ def run_pipeline(
 
     result = RemediationResult(source_path=input_path, output_path=output_path)
 
-    # Step 1: Copy to output so we only ever mutate the copy
-    shutil.copy2(input_path, output_path)
+    # Step 1: The original is only ever read; the single write below goes to
+    # output_path, so there is no need to copy the file first.
+    if output_path.resolve() == input_path.resolve():
+        raise ValueError("Output path must differ from input — never modify the original.")
 
     # Step 2: Run processors
-    with pikepdf.open(output_path, allow_overwriting_input=True) as pdf:
+    with pikepdf.open(input_path) as pdf:
         for processor_cls in _PROCESSORS:
             proc = processor_cls()  # type: ignore[call-arg]
             try:
@@ -77,17 +78,22 @@ def run_pipeline(
 
 
 def _create_sidecar(output_path: Path) -> None:
-    """Analyze the output PDF for images and create/update the sidecar file."""
+    """Find the output PDF's images and create/update the sidecar file.
+
+    Images are read back from the saved file rather than the in-memory
+    ``Pdf``: saving compresses unfiltered streams, which changes the raw
+    bytes the sidecar hashes are taken from.
+    """
     try:
         from accesspdf.analyzer import PDFAnalyzer
         from accesspdf.alttext.sidecar import SidecarManager
 
-        analysis = PDFAnalyzer().analyze(output_path)
-        if not analysis.images:
+        images = PDFAnalyzer().find_images(output_path)
+        if not images:
             return
 
         sidecar, sidecar_path = SidecarManager.load_or_create(output_path)
-        for image in analysis.images:
+        for image in images:
             sidecar.upsert(image)
 
         SidecarManager.save(sidecar, sidecar_path)
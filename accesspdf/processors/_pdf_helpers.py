@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import logging
 import threading
+from collections import deque
+from collections.abc import Iterator
 
 import pikepdf
 
@@ -12,6 +14,16 @@ logger = logging.getLogger(__name__)
 # Default timeout (seconds) for content stream parsing.
 _PARSE_TIMEOUT = 15
 
+# /Subtype values of XObjects.  Comparing a pikepdf Name against these avoids
+# converting every XObject's subtype to a Python str first.
+IMAGE_SUBTYPE = pikepdf.Name("/Image")
+FORM_SUBTYPE = pikepdf.Name("/Form")
+
+# Keys read for every page and Form.  Looking up a Name skips the str -> Name
+# conversion that a string key goes through on each access.
+_N_RESOURCES = pikepdf.Name("/Resources")
+_N_XOBJECT = pikepdf.Name("/XObject")
+
 
 def parse_content_stream_safe(
     page: pikepdf.Dictionary,
@@ -45,6 +57,51 @@ def parse_content_stream_safe(
     return result[0]
 
 
+def get_xobjects(obj: pikepdf.Object | pikepdf.Page) -> pikepdf.Dictionary | None:
+    """Return the /XObject resource dictionary of a page or Form, or None."""
+    resources = obj.get(_N_RESOURCES)
+    if not isinstance(resources, pikepdf.Dictionary):
+        return None
+    xobjects = resources.get(_N_XOBJECT)
+    if not isinstance(xobjects, pikepdf.Dictionary):
+        return None
+    return xobjects
+
+
+def iter_form_images(
+    form_xobj: pikepdf.Stream,
+    visited: set[tuple[int, int]] | None = None,
+) -> Iterator[pikepdf.Stream]:
+    """Yield every image XObject reachable from a Form XObject.
+
+    Forms may nest other Forms to any depth, so the resource tree is walked
+    breadth-first.  *visited* holds the object ids of Forms already expanded;
+    pass one set for a whole document to read each shared Form once, and to
+    stay safe against Forms that (illegally) reference themselves.
+    """
+    if visited is None:
+        visited = set()
+    visited.add(form_xobj.objgen)
+    queue: deque[pikepdf.Stream] = deque([form_xobj])
+    while queue:
+        form = queue.popleft()
+        try:
+            xobjects = get_xobjects(form)
+            if xobjects is None:
+                continue
+            for inner in xobjects.values():
+                if not isinstance(inner, pikepdf.Stream):
+                    continue
+                subtype = inner.get("/Subtype")
+                if subtype == IMAGE_SUBTYPE:
+                    yield inner
+                elif subtype == FORM_SUBTYPE and inner.objgen not in visited:
+                    visited.add(inner.objgen)
+                    queue.append(inner)
+        except Exception:
+            logger.debug("Error walking form XObject", exc_info=True)
+
+
 def ensure_struct_tree_root(pdf: pikepdf.Pdf) -> pikepdf.Dictionary:
     """Return StructTreeRoot, creating it if absent."""
     if "/StructTreeRoot" in pdf.Root:
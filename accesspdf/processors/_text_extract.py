@@ -10,7 +10,6 @@ from pdfminer.layout import (
     LAParams,
     LTAnno,
     LTChar,
-    LTFigure,
     LTLine,
     LTRect,
     LTTextBox,
@@ -59,33 +58,30 @@ def extract_text_blocks(pdf_path: Path) -> list[TextBlock]:
 def _extract_from_element(
     element: object, page: int, blocks: list[TextBlock]
 ) -> None:
-    """Recursively extract TextBlocks from layout elements."""
-    if isinstance(element, LTTextBox):
-        for line in element:
-            if isinstance(line, LTTextLine):
-                text = line.get_text().strip()
-                if not text:
-                    continue
-                font_name, font_size = _dominant_font_from_line(line)
-                blocks.append(TextBlock(
-                    text=text,
-                    page=page,
-                    x0=line.x0,
-                    y0=line.y0,
-                    x1=line.x1,
-                    y1=line.y1,
-                    font_name=font_name,
-                    font_size=font_size,
-                    is_bold=is_bold_font(font_name),
-                ))
-        return
-
-    if isinstance(element, LTFigure):
-        for child in element:
-            _extract_from_element(child, page, blocks)
-    elif hasattr(element, "__iter__"):
-        for child in element:  # type: ignore[union-attr]
-            _extract_from_element(child, page, blocks)
+    """Extract TextBlocks from a layout tree, in document order."""
+    stack = [element]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, LTTextBox):
+            for line in element:
+                if isinstance(line, LTTextLine):
+                    text = line.get_text().strip()
+                    if not text:
+                        continue
+                    font_name, font_size = _dominant_font_from_line(line)
+                    blocks.append(TextBlock(
+                        text=text,
+                        page=page,
+                        x0=line.x0,
+                        y0=line.y0,
+                        x1=line.x1,
+                        y1=line.y1,
+                        font_name=font_name,
+                        font_size=font_size,
+                        is_bold=is_bold_font(font_name),
+                    ))
+        elif hasattr(element, "__iter__"):  # LTPage, LTFigure, other containers
+            stack.extend(reversed(list(element)))  # type: ignore[call-overload]
 
 
 def extract_ruling_lines(pdf_path: Path) -> list[RulingLine]:
@@ -102,45 +98,49 @@ def extract_ruling_lines(pdf_path: Path) -> list[RulingLine]:
 def _extract_lines_from_element(
     element: object, page: int, lines: list[RulingLine]
 ) -> None:
-    """Recursively find LTLine and LTRect elements."""
-    if isinstance(element, LTLine):
-        dx = abs(element.x1 - element.x0)
-        dy = abs(element.y1 - element.y0)
-        if dx > dy:
-            orientation = "horizontal"
-        else:
-            orientation = "vertical"
-        lines.append(RulingLine(
-            x0=element.x0, y0=element.y0,
-            x1=element.x1, y1=element.y1,
-            page=page, orientation=orientation,
-        ))
-    elif isinstance(element, LTRect):
-        # A rect defines 4 lines — extract the borders
-        lines.append(RulingLine(
-            x0=element.x0, y0=element.y0,
-            x1=element.x1, y1=element.y0,
-            page=page, orientation="horizontal",
-        ))
-        lines.append(RulingLine(
-            x0=element.x0, y0=element.y1,
-            x1=element.x1, y1=element.y1,
-            page=page, orientation="horizontal",
-        ))
-        lines.append(RulingLine(
-            x0=element.x0, y0=element.y0,
-            x1=element.x0, y1=element.y1,
-            page=page, orientation="vertical",
-        ))
-        lines.append(RulingLine(
-            x0=element.x1, y0=element.y0,
-            x1=element.x1, y1=element.y1,
-            page=page, orientation="vertical",
-        ))
-
-    if hasattr(element, "__iter__") and not isinstance(element, (LTLine, LTRect)):
-        for child in element:  # type: ignore[union-attr]
-            _extract_lines_from_element(child, page, lines)
+    """Find LTLine and LTRect elements in a layout tree, in document order."""
+    stack = [element]
+    while stack:
+        element = stack.pop()
+        if isinstance(element, LTLine):
+            dx = abs(element.x1 - element.x0)
+            dy = abs(element.y1 - element.y0)
+            if dx > dy:
+                orientation = "horizontal"
+            else:
+                orientation = "vertical"
+            lines.append(RulingLine(
+                x0=element.x0, y0=element.y0,
+                x1=element.x1, y1=element.y1,
+                page=page, orientation=orientation,
+            ))
+        elif isinstance(element, LTRect):
+            # A rect defines 4 lines — extract the borders
+            lines.append(RulingLine(
+                x0=element.x0, y0=element.y0,
+                x1=element.x1, y1=element.y0,
+                page=page, orientation="horizontal",
+            ))
+            lines.append(RulingLine(
+                x0=element.x0, y0=element.y1,
+                x1=element.x1, y1=element.y1,
+                page=page, orientation="horizontal",
+            ))
+            lines.append(RulingLine(
+                x0=element.x0, y0=element.y0,
+                x1=element.x0, y1=element.y1,
+                page=page, orientation="vertical",
+            ))
+            lines.append(RulingLine(
+                x0=element.x1, y0=element.y0,
+                x1=element.x1, y1=element.y1,
+                page=page, orientation="vertical",
+            ))
+        elif isinstance(element, LTTextBox):
+            # Text boxes only hold lines of characters, never rulings
+            continue
+        elif hasattr(element, "__iter__"):
+            stack.extend(reversed(list(element)))  # type: ignore[call-overload]
 
 
 def extract_full_text(pdf_path: Path) -> str:
@@ -15,10 +15,12 @@ import pikepdf
 from accesspdf.models import ProcessorResult
 from accesspdf.pipeline import register_processor
 from accesspdf.processors._pdf_helpers import (
+    IMAGE_SUBTYPE,
     add_kid,
     ensure_mark_info,
     ensure_parent_tree,
     ensure_struct_tree_root,
+    get_xobjects,
     make_struct_elem,
     parse_content_stream_safe,
 )
@@ -266,9 +268,10 @@ class TaggerProcessor:
                         if idx not in page_arrays:
                             page_arrays[idx] = []
                         arr = page_arrays[idx]
+                        top = max(mcids)
+                        if len(arr) <= top:
+                            arr.extend([None] * (top + 1 - len(arr)))
                         for m in mcids:
-                            while len(arr) <= m:
-                                arr.append(None)
                             if arr[m] is None:
                                 arr[m] = kid
                         break
@@ -277,13 +280,8 @@ class TaggerProcessor:
 
         nums = pikepdf.Array()
         for page_idx in sorted(page_arrays.keys()):
-            arr = page_arrays[page_idx]
-            pdf_arr = pikepdf.Array()
-            for elem in arr:
-                if elem is None:
-                    pdf_arr.append(pikepdf.Null())
-                else:
-                    pdf_arr.append(elem)
+            # Built in one shot; pikepdf stores None as a PDF null
+            pdf_arr = pikepdf.Array(page_arrays[page_idx])
             nums.append(page_idx)
             nums.append(pdf.make_indirect(pdf_arr))
 
@@ -399,15 +397,12 @@ class TaggerProcessor:
         """Return set of XObject names (e.g. '/Im0') that are images."""
         names: set[str] = set()
         try:
-            resources = page.get("/Resources")
-            if resources is None or "/XObject" not in resources:
+            xobjects = get_xobjects(page)
+            if xobjects is None:
                 return names
-            for name, xobj_ref in resources["/XObject"].items():
-                xobj = xobj_ref
-                if hasattr(xobj, "resolve"):
-                    xobj = xobj.resolve()
+            for name, xobj in xobjects.items():
                 if isinstance(xobj, pikepdf.Stream):
-                    if str(xobj.get("/Subtype", "")) == "/Image":
+                    if xobj.get("/Subtype") == IMAGE_SUBTYPE:
                         # pikepdf dict keys may or may not include leading /
                         key = name if name.startswith("/") else f"/{name}"
                         names.add(key)
@@ -5,13 +5,12 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from PIL import Image
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import VerticalScroll
 from textual.widgets import Footer, Header
 
-from accesspdf.alttext.extract import extract_all_images
+from accesspdf.alttext.extract import LazyImage, extract_all_images
 from accesspdf.alttext.sidecar import AltTextEntry, SidecarFile, SidecarManager
 from accesspdf.models import AltTextStatus
 from accesspdf.review.renderer import image_dimensions_text, render_image_plain
@@ -61,7 +60,7 @@ class ReviewApp(App):
         self.sidecar = sidecar
         self.sidecar_path = sidecar_path
         self.current_index = 0
-        self.images: dict[str, Image.Image] = {}
+        self.images: dict[str, LazyImage] = {}
         self._dirty = False
 
     def compose(self) -> ComposeResult:
@@ -138,7 +137,8 @@ class ReviewApp(App):
         nav.progress = f"{reviewed} / {len(self.entries)} reviewed  |  Image {self.current_index + 1} of {len(self.entries)}"
 
         # Render image preview
-        pil_image = self.images.get(entry.hash)
+        lazy_image = self.images.get(entry.hash)
+        pil_image = lazy_image() if lazy_image is not None else None
         if pil_image is not None:
             preview.preview_text = render_image_plain(pil_image, max_width=60, max_height=12)
             meta = image_dimensions_text(pil_image.width, pil_image.height, entry.page, entry.id)
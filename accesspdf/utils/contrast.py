@@ -14,15 +14,28 @@ def _srgb_to_linear(v: float) -> float:
     return ((v + 0.055) / 1.055) ** 2.4
 
 
+# Linearized value of every 8-bit channel level.  Colors parsed from content
+# streams are always clamped 0-255 ints, so luminance is three table lookups
+# rather than three fractional powers.
+_LINEAR_CHANNEL = tuple(_srgb_to_linear(v / 255.0) for v in range(256))
+
+
+def _linear(v: int) -> float:
+    """Linearize a 0-255 sRGB channel, via the lookup table when it can."""
+    if isinstance(v, int) and 0 <= v <= 255:
+        return _LINEAR_CHANNEL[v]
+    return _srgb_to_linear(v / 255.0)
+
+
 def relative_luminance(r: int, g: int, b: int) -> float:
     """Compute relative luminance for an sRGB color (0-255 per channel).
 
     Per WCAG 2.1: L = 0.2126*R + 0.7152*G + 0.0722*B
     where R, G, B are linearized sRGB values.
     """
-    rl = _srgb_to_linear(r / 255.0)
-    gl = _srgb_to_linear(g / 255.0)
-    bl = _srgb_to_linear(b / 255.0)
+    rl = _linear(r)
+    gl = _linear(g)
+    bl = _linear(b)
     return 0.2126 * rl + 0.7152 * gl + 0.0722 * bl
 
 
@@ -0,0 +1,141 @@
+"""Content hashing for PDF image streams.
+
+Sidecar entries are keyed on the md5 of an image XObject's raw (still
+encoded) stream bytes.  The analyzer, extractor and injector must all agree
+on that key, so they hash through this module rather than calling
+:mod:`hashlib` directly.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pikepdf
+
+from accesspdf.processors._pdf_helpers import (
+    FORM_SUBTYPE,
+    IMAGE_SUBTYPE,
+    get_xobjects,
+    iter_form_images,
+)
+
+logger = logging.getLogger(__name__)
+
+# Minimum pages per worker before image hashes are precomputed in parallel.
+# Each worker reopens the PDF, which only pays off on larger documents.
+_PARALLEL_MIN_PAGES = 8
+
+# Upper bound on prehash threads in this process; None means one per CPU.
+_max_workers: int | None = None
+
+
+def limit_prehash_workers(workers: int) -> None:
+    """Cap the threads ``prehash_pdf_images`` may use in this process.
+
+    ``batch --jobs`` already runs one process per CPU, so it sets a cap of 1
+    in each worker process to avoid spawning CPU-count threads per file.
+    """
+    global _max_workers
+    _max_workers = workers
+
+
+def hash_image_bytes(raw: bytes) -> str:
+    """Return the sidecar hash (md5 hex digest) of raw image stream bytes.
+
+    The digest is an identity key, not a security boundary, so it is
+    requested with ``usedforsecurity=False`` to stay available on
+    FIPS-restricted OpenSSL builds.
+    """
+    return hashlib.md5(raw, usedforsecurity=False).hexdigest()
+
+
+def hash_image_stream(
+    xobj: pikepdf.Stream,
+    cache: dict[tuple[int, int], str] | None = None,
+) -> str:
+    """Return the sidecar hash of an image XObject's raw stream.
+
+    ``read_raw_bytes()`` already returns a buffer that :mod:`hashlib`
+    consumes directly, so no intermediate copy of the (possibly very large)
+    encoded image is made.
+
+    When *cache* is given, digests are memoized by the stream's indirect
+    object id, so an XObject referenced from many pages (logos, headers)
+    is read and hashed only once per document.
+    """
+    if cache is None:
+        return hash_image_bytes(xobj.read_raw_bytes())
+    key = xobj.objgen
+    if key == (0, 0):  # direct object -- no stable identity to key on
+        return hash_image_bytes(xobj.read_raw_bytes())
+    digest = cache.get(key)
+    if digest is None:
+        digest = cache[key] = hash_image_bytes(xobj.read_raw_bytes())
+    return digest
+
+
+def prehash_pdf_images(
+    pdf_path: Path,
+    page_count: int,
+    min_pages: int | None = None,
+) -> dict[tuple[int, int], str]:
+    """Hash every image XObject in a large PDF on a thread pool.
+
+    Returns an objgen -> digest map to seed a ``hash_image_stream`` cache, or
+    an empty map for documents with fewer than *min_pages* pages per worker.
+    :mod:`hashlib` releases the GIL while digesting large buffers, so the
+    workers hash streams concurrently.  Each opens its own read-only
+    ``pikepdf.Pdf`` on a page range, since a handle can't be shared across
+    threads; object ids are stable across opens of an unchanged file, so
+    the map applies to the caller's handle as well.
+    """
+    if min_pages is None:
+        min_pages = _PARALLEL_MIN_PAGES
+    workers = min(
+        _max_workers or os.cpu_count() or 1, page_count // max(min_pages, 1)
+    )
+    if workers <= 1:
+        return {}
+
+    step = -(-page_count // workers)  # ceil division
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_hash_page_range, pdf_path, start, min(start + step, page_count))
+            for start in range(0, page_count, step)
+        ]
+        cache: dict[tuple[int, int], str] = {}
+        for future in futures:
+            try:
+                cache.update(future.result())
+            except Exception:
+                logger.debug("Parallel image hashing failed for a page range", exc_info=True)
+    return cache
+
+
+def _hash_page_range(pdf_path: Path, start: int, stop: int) -> dict[tuple[int, int], str]:
+    """Hash the images on pages ``start`` to ``stop`` (0-based, exclusive)."""
+    cache: dict[tuple[int, int], str] = {}
+    visited: set[tuple[int, int]] = set()
+    with pikepdf.open(pdf_path) as pdf:
+        for page_idx in range(start, stop):
+            page = pdf.pages[page_idx]
+            xobjects = get_xobjects(page)
+            if xobjects is None:
+                continue
+            for xobj in xobjects.values():
+                try:
+                    if not isinstance(xobj, pikepdf.Stream):
+                        continue
+                    subtype = xobj.get("/Subtype")
+                    if subtype == IMAGE_SUBTYPE:
+                        hash_image_stream(xobj, cache)
+                    elif subtype == FORM_SUBTYPE and xobj.objgen not in visited:
+                        for inner in iter_form_images(xobj, visited):
+                            hash_image_stream(inner, cache)
+                except Exception:
+                    logger.debug("Could not hash XObject on page %d", page_idx, exc_info=True)
+    return cache
@@ -15,7 +15,7 @@ from typing import List
 from fastapi import FastAPI, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 
-from accesspdf.alttext.sidecar import SidecarFile, SidecarManager
+from accesspdf.alttext.sidecar import SidecarFile, SidecarManager, group_by_hash
 from accesspdf.models import AltTextStatus
 
 def _clean_title(name: str) -> str:
@@ -136,7 +136,8 @@ def _process_job(job: _Job) -> None:
     try:
         sidecar_path = SidecarManager.sidecar_path_for(output_path)
         if sidecar_path.is_file():
-            job.sidecar = SidecarManager.load(sidecar_path)
+            # Written moments ago by run_pipeline, so skip re-validation
+            job.sidecar = SidecarManager.load(sidecar_path, trusted=True)
             job.sidecar_path = sidecar_path
         else:
             job.sidecar = SidecarFile(document=output_path.name)
@@ -158,9 +159,11 @@ def _generate_alt_text(job: _Job, provider: object, pending_entries: list,
     import asyncio
 
     async def _run() -> None:
-        from accesspdf.alttext.extract import extract_image, prepare_for_ai
+        from accesspdf.alttext.extract import extract_all_images, prepare_for_ai
         from accesspdf.providers.base import ImageContext
 
+        images = {h: lazy for h, _page, lazy in extract_all_images(job.output_path)}
+
         job.gen_stage = "generating"
         job.gen_total = len(pending_entries)
         job.gen_current = 0
@@ -169,12 +172,16 @@ def _generate_alt_text(job: _Job, provider: object, pending_entries: list,
         sem = asyncio.Semaphore(_CONCURRENT_REQUESTS)
         completed = 0
 
-        async def _process_one(entry: object) -> None:
+        by_hash = group_by_hash(pending_entries)
+
+        async def _process_one(entries: list) -> None:
             nonlocal completed
+            entry = entries[0]
             try:
-                img = extract_image(job.output_path, entry.hash)
+                lazy = images.pop(entry.hash, None)
+                img = lazy() if lazy is not None else None
                 if img is None:
-                    completed += 1
+                    completed += len(entries)
                     job.gen_current = completed
                     return
 
@@ -192,16 +199,17 @@ def _generate_alt_text(job: _Job, provider: object, pending_entries: list,
 
                 if result.alt_text:
                     with job.sidecar_lock:
-                        entry.ai_draft = result.alt_text
+                        for e in entries:
+                            e.ai_draft = result.alt_text
                 elif result.error:
                     job.gen_errors.append({"image_id": entry.id, "error": result.error})
             except Exception as exc:
                 job.gen_errors.append({"image_id": entry.id, "error": str(exc)})
 
-            completed += 1
+            completed += len(entries)
             job.gen_current = completed
 
-        await asyncio.gather(*[_process_one(e) for e in pending_entries])
+        await asyncio.gather(*[_process_one(g) for g in by_hash.values()])
 
         # Save sidecar
         if job.sidecar_path:
@@ -1,10 +1,15 @@
-"""Tests for the PDF analyzer, focusing on scanned PDF detection."""
+"""Tests for the PDF analyzer: scanned detection, tag walk, and image scan."""
 
 from __future__ import annotations
 
 from pathlib import Path
 
+import pikepdf
+import pytest
+
+from accesspdf import analyzer
 from accesspdf.analyzer import PDFAnalyzer
+from accesspdf.models import AnalysisResult
 
 
 class TestScannedDetection:
@@ -36,3 +41,137 @@ class TestScannedDetection:
         analyzer = PDFAnalyzer()
         result = analyzer.analyze(images_pdf)
         assert result.is_scanned is False
+
+    def test_bad_fill_color_page_still_counts_as_scanned(self, tmp_path: Path) -> None:
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        image = pdf.make_stream(
+            b"\x00",
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=1, Height=1, BitsPerComponent=8, ColorSpace=pikepdf.Name.DeviceGray,
+        )
+        pdf.pages[0].Resources = pikepdf.Dictionary(
+            XObject=pikepdf.Dictionary(Im0=image)
+        )
+        pdf.pages[0].Contents = pdf.make_stream(b"/Foo 0 0 rg q 1 0 0 1 0 0 cm /Im0 Do Q")
+        path = tmp_path / "bad_color.pdf"
+        pdf.save(path)
+
+        assert PDFAnalyzer().analyze(path).is_scanned is True
+
+
+class TestStructTreeWalk:
+    def test_document_order_and_cycle(self) -> None:
+        """Tags come out in pre-order and a /K cycle doesn't loop forever."""
+        pdf = pikepdf.new()
+        sect = pdf.make_indirect(pikepdf.Dictionary(S=pikepdf.Name.Sect))
+        para = pdf.make_indirect(pikepdf.Dictionary(S=pikepdf.Name.P, K=sect))
+        head = pdf.make_indirect(pikepdf.Dictionary(S=pikepdf.Name.H1, Alt="Title"))
+        sect.K = pikepdf.Array([para, head])
+        root = pdf.make_indirect(pikepdf.Dictionary(K=sect))
+
+        result = AnalysisResult(source_path=Path("cycle.pdf"))
+        PDFAnalyzer()._walk_struct_tree(root, result)
+
+        assert [t.tag_type for t in result.tags] == ["Sect", "P", "H1"]
+        assert result.tags[2].alt_text == "Title"
+
+    def test_marked_content_leaves_are_skipped(self) -> None:
+        pdf = pikepdf.new()
+        mcr = pikepdf.Dictionary(Type=pikepdf.Name.MCR, MCID=0)
+        para = pdf.make_indirect(pikepdf.Dictionary(
+            S=pikepdf.Name.P, K=pikepdf.Array([mcr, 1, pikepdf.Dictionary(
+                S=pikepdf.Name.Span, K=2,
+            )]),
+        ))
+        root = pdf.make_indirect(pikepdf.Dictionary(K=para))
+
+        result = AnalysisResult(source_path=Path("leaves.pdf"))
+        PDFAnalyzer()._walk_struct_tree(root, result)
+
+        assert [t.tag_type for t in result.tags] == ["P", "Span"]
+
+    def test_untyped_intermediate_node_is_walked(self) -> None:
+        """A dict with /K but no /S still leads to the tags below it."""
+        pdf = pikepdf.new()
+        figure = pikepdf.Dictionary(S=pikepdf.Name.Figure, Alt="Logo")
+        wrapper = pikepdf.Dictionary(K=pikepdf.Array([figure, pikepdf.Dictionary()]))
+        objr = pikepdf.Dictionary(Type=pikepdf.Name.OBJR, K=pikepdf.Dictionary(
+            S=pikepdf.Name.Link,
+        ))
+        para = pdf.make_indirect(pikepdf.Dictionary(
+            S=pikepdf.Name.P, K=pikepdf.Array([wrapper, objr]),
+        ))
+        root = pdf.make_indirect(pikepdf.Dictionary(K=para))
+
+        result = AnalysisResult(source_path=Path("untyped.pdf"))
+        PDFAnalyzer()._walk_struct_tree(root, result)
+
+        assert [t.tag_type for t in result.tags] == ["P", "Figure"]
+        assert result.tags[1].alt_text == "Logo"
+
+
+class TestImageScan:
+    def test_text_only_pdf_skips_image_scan(
+        self, simple_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            analyzer, "prehash_pdf_images",
+            lambda *args: pytest.fail("image scan ran on a text-only PDF"),
+        )
+        assert PDFAnalyzer().analyze(simple_pdf).images == []
+
+    def test_images_pdf_still_scanned(self, images_pdf: Path) -> None:
+        assert PDFAnalyzer().analyze(images_pdf).images
+
+    def test_color_space_reports_family_name(self, tmp_path: Path) -> None:
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        icc = pdf.make_stream(b"\x00" * 128, N=3)
+        image = pdf.make_stream(
+            b"\x00\xff\x00",
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=1, Height=1, BitsPerComponent=8,
+            ColorSpace=pikepdf.Array([pikepdf.Name.ICCBased, icc]),
+        )
+        pdf.pages[0].Resources = pikepdf.Dictionary(
+            XObject=pikepdf.Dictionary(Im0=image)
+        )
+        path = tmp_path / "icc.pdf"
+        pdf.save(path)
+
+        [info] = PDFAnalyzer().analyze(path).images
+        assert info.color_space == "/ICCBased"
+
+
+class TestTextOps:
+    def test_text_and_fill_colors_in_one_pass(self) -> None:
+        pdf = pikepdf.new()
+        ops = pikepdf.parse_content_stream(pikepdf.Stream(
+            pdf,
+            b"0.5 g BT (a) Tj 1 0 0 rg (b) Tj (c) Tj ET 0 0 1 rg (d) Tj",
+        ))
+        has_text, colors = PDFAnalyzer()._scan_text_ops(ops)
+        assert has_text is True
+        assert colors == [(128, 128, 128), (255, 0, 0)]
+
+    def test_no_ops(self) -> None:
+        assert PDFAnalyzer()._scan_text_ops(None) == (False, [])
+
+    def test_bad_fill_color_still_reports_text(self) -> None:
+        pdf = pikepdf.new()
+        ops = pikepdf.parse_content_stream(pikepdf.Stream(
+            pdf, b"1 0 0 rg BT (a) Tj ET /Foo 0 0 rg BT (b) Tj ET",
+        ))
+        assert PDFAnalyzer()._scan_text_ops(ops) == (True, [])
+
+
+
+class TestFindImages:
+    def test_matches_full_analysis(self, images_pdf: Path) -> None:
+        full = PDFAnalyzer().analyze(images_pdf).images
+        assert full
+        assert PDFAnalyzer().find_images(images_pdf) == full
+
+    def test_text_only_pdf(self, simple_pdf: Path) -> None:
+        assert PDFAnalyzer().find_images(simple_pdf) == []
@@ -91,3 +91,46 @@ class TestBatchProcessing:
 
         pdf_files = list(test_dir.glob("*.pdf"))
         assert len(pdf_files) == 0
+
+
+class TestBatchCommand:
+    def test_collects_pdfs(self, tmp_path: Path) -> None:
+        from accesspdf.cli import _iter_pdfs
+
+        (tmp_path / "sub" / "deeper").mkdir(parents=True)
+        for name in ("a.pdf", "REPORT.PDF", "notes.txt", "sub/b.pdf", "sub/deeper/c.pdf"):
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "folder.pdf").mkdir()
+
+        assert sorted(_iter_pdfs(tmp_path, False)) == [
+            tmp_path / "REPORT.PDF",
+            tmp_path / "a.pdf",
+        ]
+        assert sorted(_iter_pdfs(tmp_path, True)) == [
+            tmp_path / "REPORT.PDF",
+            tmp_path / "a.pdf",
+            tmp_path / "sub" / "b.pdf",
+            tmp_path / "sub" / "deeper" / "c.pdf",
+        ]
+
+    def test_parallel_jobs(self, corpus_dir: Path, tmp_path: Path) -> None:
+        """With several workers every file is fixed and failures still report."""
+        from typer.testing import CliRunner
+
+        from accesspdf.cli import app
+
+        in_dir = tmp_path / "in"
+        in_dir.mkdir()
+        shutil.copy(corpus_dir / "simple.pdf", in_dir / "simple.pdf")
+        shutil.copy(corpus_dir / "headings.pdf", in_dir / "headings.pdf")
+        (in_dir / "bad.pdf").write_text("not a real pdf")
+        out_dir = tmp_path / "out"
+
+        result = CliRunner().invoke(
+            app, ["batch", str(in_dir), "-o", str(out_dir), "--jobs", "2"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert (out_dir / "simple_accessible.pdf").is_file()
+        assert (out_dir / "headings_accessible.pdf").is_file()
+        assert "bad.pdf" in result.output
@@ -29,6 +29,12 @@ class TestRelativeLuminance:
         lum = relative_luminance(255, 0, 0)
         assert 0.20 < lum < 0.22  # ~0.2126
 
+    def test_int_and_float_channels_agree(self) -> None:
+        for v in (0, 10, 11, 128, 254, 255):
+            assert relative_luminance(v, v, v) == relative_luminance(
+                float(v), float(v), float(v)
+            )
+
 
 class TestContrastRatio:
     def test_black_on_white(self) -> None:
@@ -99,6 +105,40 @@ class TestAnalyzerContrast:
         # simple_pdf uses default black text; should not flag
         assert len(contrast_rules) == 0
 
+    def test_long_page_list_is_summarized(self) -> None:
+        from accesspdf.analyzer import PDFAnalyzer
+        from accesspdf.models import AnalysisResult
+
+        result = AnalysisResult(source_path=Path("faint.pdf"))
+        PDFAnalyzer()._check_contrast([2, 4, 6, 8, 10], 12, [], 0, result)
+        [issue] = result.issues
+        assert issue.rule == "contrast-low"
+        assert "page(s) 2, 4, 6, 8, 10 and 7 more." in issue.message
+
+    def test_scanned_pdf_skips_contrast(self, tmp_path: Path) -> None:
+        import pikepdf
+
+        from accesspdf.analyzer import PDFAnalyzer
+
+        pdf = pikepdf.new()
+        image = pdf.make_stream(
+            b"\x00",
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=1, Height=1, BitsPerComponent=8,
+            ColorSpace=pikepdf.Name.DeviceGray,
+        )
+        for content in [b"q /Im0 Do Q"] * 10 + [b"q /Im0 Do Q BT 0.9 g (x) Tj ET"]:
+            pdf.add_blank_page()
+            page = pdf.pages[-1]
+            page.Resources = pikepdf.Dictionary(XObject=pikepdf.Dictionary(Im0=image))
+            page.Contents = pdf.make_stream(content)
+        path = tmp_path / "scanned_faint.pdf"
+        pdf.save(path)
+
+        result = PDFAnalyzer().analyze(path)
+        assert result.is_scanned is True
+        assert not [i for i in result.issues if i.rule.startswith("contrast-")]
+
 
 class TestAnalyzerLinks:
     def test_no_link_issues_in_simple(self, simple_pdf: Path) -> None:
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
+import pikepdf
+import pytest
 from PIL import Image
 
-from accesspdf.alttext.extract import extract_all_images, extract_image
+from accesspdf.alttext import extract
+from accesspdf.alttext.extract import (
+    LazyImage,
+    extract_all_images,
+    extract_image,
+    prepare_for_ai,
+)
 
 
 class TestExtractAllImages:
@@ -21,13 +30,39 @@ class TestExtractAllImages:
             assert len(img_hash) == 32  # md5 hex digest
             assert isinstance(page, int)
             assert page >= 1
-            assert isinstance(img, Image.Image)
+            assert isinstance(img, LazyImage)
+            assert isinstance(img(), Image.Image)
+
+    def test_decodes_lazily_once(self, images_pdf: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[object] = []
+        real = extract._xobj_to_pil
+
+        def counting(xobj: pikepdf.Stream) -> Image.Image | None:
+            calls.append(xobj)
+            return real(xobj)
+
+        monkeypatch.setattr(extract, "_xobj_to_pil", counting)
+        results = extract_all_images(images_pdf)
+        assert calls == []
+
+        lazy = results[0][2]
+        assert lazy() is lazy()
+        assert len(calls) == 1
 
     def test_deduplicates(self, images_pdf: Path) -> None:
         results = extract_all_images(images_pdf)
         hashes = [h for h, _, _ in results]
         assert len(hashes) == len(set(hashes))
 
+    def test_parallel_matches_sequential(
+        self, scanned_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sequential = extract_all_images(scanned_pdf)
+        monkeypatch.setattr(extract, "_PARALLEL_MIN_PAGES", 1)
+        monkeypatch.setattr(extract.os, "cpu_count", lambda: 4)
+        parallel = extract_all_images(scanned_pdf)
+        assert [(h, p) for h, p, _ in parallel] == [(h, p) for h, p, _ in sequential]
+
     def test_no_images_in_simple(self, simple_pdf: Path) -> None:
         results = extract_all_images(simple_pdf)
         assert len(results) == 0
@@ -52,4 +87,156 @@ class TestExtractImage:
         for img_hash, _, img_from_all in all_images:
             img_single = extract_image(images_pdf, img_hash)
             assert img_single is not None
-            assert img_single.size == img_from_all.size
+            assert img_single.size == img_from_all().size
+
+    def test_hashes_match_analyzer(self, images_pdf: Path) -> None:
+        """Extractor and analyzer must key images identically for sidecar lookups."""
+        from accesspdf.analyzer import PDFAnalyzer
+
+        analysis = PDFAnalyzer().analyze(images_pdf)
+        extracted = {h for h, _, _ in extract_all_images(images_pdf)}
+        assert extracted == {img.image_hash for img in analysis.images}
+
+
+class TestNestedForms:
+    @pytest.fixture
+    def nested_form_pdf(self, tmp_path: Path) -> Path:
+        """Page -> Form -> Form -> Image, with the inner Form referencing itself."""
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        image = pdf.make_stream(
+            bytes([200, 10, 10]) * 4,
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=2, Height=2, BitsPerComponent=8,
+            ColorSpace=pikepdf.Name.DeviceRGB,
+        )
+        inner = pdf.make_stream(
+            b"/Im0 Do",
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Form,
+            BBox=[0, 0, 2, 2],
+        )
+        inner.Resources = pikepdf.Dictionary(
+            XObject=pikepdf.Dictionary(Im0=image, Self=inner)
+        )
+        outer = pdf.make_stream(
+            b"/Fx1 Do",
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Form,
+            BBox=[0, 0, 2, 2],
+            Resources=pikepdf.Dictionary(XObject=pikepdf.Dictionary(Fx1=inner)),
+        )
+        page = pdf.pages[0]
+        page.Resources = pikepdf.Dictionary(
+            XObject=pikepdf.Dictionary(Fx0=outer)
+        )
+        page.Contents = pdf.make_stream(b"/Fx0 Do")
+        path = tmp_path / "nested.pdf"
+        pdf.save(path)
+        return path
+
+    def test_finds_image_two_forms_deep(self, nested_form_pdf: Path) -> None:
+        results = extract_all_images(nested_form_pdf)
+        assert len(results) == 1
+        img_hash, page, img = results[0]
+        assert page == 1
+        assert img().size == (2, 2)
+        assert extract_image(nested_form_pdf, img_hash) is not None
+
+    def test_matches_analyzer(self, nested_form_pdf: Path) -> None:
+        from accesspdf.analyzer import PDFAnalyzer
+
+        analysis = PDFAnalyzer().analyze(nested_form_pdf)
+        extracted = [(h, page) for h, page, _ in extract_all_images(nested_form_pdf)]
+        assert extracted == [(img.image_hash, img.page) for img in analysis.images]
+
+
+class TestRawDecodeFallback:
+    def test_unknown_colorspace_decodes_as_rgb(self) -> None:
+        pdf = pikepdf.new()
+        pixels = bytes([10, 20, 30]) * 16 + b"\x00\x00"  # trailing padding
+        xobj = pikepdf.Stream(
+            pdf, pixels,
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=4, Height=4, BitsPerComponent=8,
+            ColorSpace=pikepdf.Name("/Bogus"),
+        )
+        img = extract._xobj_to_pil(xobj)
+        assert img is not None
+        assert img.mode == "RGB"
+        assert img.size == (4, 4)
+        assert img.getpixel((3, 3)) == (10, 20, 30)
+
+    @pytest.mark.parametrize(
+        ("bpc", "row", "expected"),
+        [
+            (1, bytes([0b10100000]), [255, 0, 255]),
+            (2, bytes([0b00011011]), [0, 85, 170]),
+            (4, bytes([0x0F, 0xA0]), [0, 255, 170]),
+            (16, bytes([0x12, 0x34, 0xAB, 0xCD, 0xFF, 0x00]), [0x12, 0xAB, 0xFF]),
+        ],
+    )
+    def test_packed_gray(self, bpc: int, row: bytes, expected: list[int]) -> None:
+        pdf = pikepdf.new()
+        xobj = pikepdf.Stream(
+            pdf, row * 2,
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=3, Height=2, BitsPerComponent=bpc,
+            ColorSpace=pikepdf.Name("/Gray"),  # abbreviated name pikepdf rejects
+        )
+        img = extract._xobj_to_pil(xobj)
+        assert img is not None
+        assert img.mode == "L"
+        assert [img.getpixel((x, 1)) for x in range(3)] == expected
+
+
+class TestEnsureRgb:
+    @pytest.mark.parametrize(
+        ("mode", "expected"),
+        [("RGB", "RGB"), ("L", "L"), ("1", "L"), ("RGBA", "RGBA"), ("LA", "RGBA"),
+         ("CMYK", "RGB"), ("P", "RGB"), ("I", "RGB")],
+    )
+    def test_mode_mapping(self, mode: str, expected: str) -> None:
+        assert extract._ensure_rgb(Image.new(mode, (2, 2))).mode == expected
+
+    def test_supported_mode_is_not_copied(self) -> None:
+        img = Image.new("RGBA", (2, 2))
+        assert extract._ensure_rgb(img) is img
+
+
+class TestPrepareForAi:
+    def test_downsizes_to_max_dim(self) -> None:
+        img = Image.new("RGB", (2000, 1000), "white")
+        out = Image.open(io.BytesIO(prepare_for_ai(img)))
+        assert out.format == "PNG"
+        assert out.size == (512, 256)
+
+    def test_small_image_keeps_size(self) -> None:
+        img = Image.new("L", (40, 30))
+        out = Image.open(io.BytesIO(prepare_for_ai(img)))
+        assert out.size == (40, 30)
+
+    def test_jpeg_output(self) -> None:
+        img = Image.new("RGBA", (800, 600), (255, 0, 0, 128))
+        out = Image.open(io.BytesIO(prepare_for_ai(img, fmt="JPEG")))
+        assert out.format == "JPEG"
+        assert out.mode == "RGB"
+        assert max(out.size) == 512
+
+    def test_jpeg_source_is_drafted(self) -> None:
+        buf = io.BytesIO()
+        Image.new("RGB", (3000, 2000), "blue").save(buf, format="JPEG")
+        buf.seek(0)
+        src = Image.open(buf)
+        draft_sizes = []
+        real_draft = src.draft
+
+        def _spy(mode: str, size: tuple[int, int]) -> object:
+            draft_sizes.append(size)
+            return real_draft(mode, size)
+
+        src.draft = _spy  # type: ignore[method-assign]
+        out = Image.open(io.BytesIO(prepare_for_ai(src)))
+
+        assert draft_sizes == [(512, 512)]
+        # libjpeg decoded at a reduced DCT scale, not at full resolution
+        assert src.size[0] < 3000
+        assert out.size == (512, 341)
@@ -0,0 +1,71 @@
+"""Tests for image stream hashing."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+import pikepdf
+import pytest
+
+from accesspdf.utils import hashing
+from accesspdf.utils.hashing import hash_image_bytes, hash_image_stream, prehash_pdf_images
+
+
+def _first_image(pdf: pikepdf.Pdf) -> pikepdf.Stream:
+    for xobj in pdf.pages[0]["/Resources"]["/XObject"].values():
+        if xobj.get("/Subtype") == pikepdf.Name("/Image"):
+            return xobj
+    raise AssertionError("no image XObject on page 1")
+
+
+class TestHashImageBytes:
+    def test_is_md5_hex(self) -> None:
+        assert hash_image_bytes(b"pixels") == hashlib.md5(b"pixels").hexdigest()
+
+
+class TestHashImageStream:
+    def test_matches_raw_bytes(self, images_pdf: Path) -> None:
+        with pikepdf.open(images_pdf) as pdf:
+            xobj = _first_image(pdf)
+            assert hash_image_stream(xobj) == hash_image_bytes(xobj.read_raw_bytes())
+
+    def test_cache_keyed_by_objgen(self, images_pdf: Path) -> None:
+        cache: dict[tuple[int, int], str] = {}
+        with pikepdf.open(images_pdf) as pdf:
+            xobj = _first_image(pdf)
+            digest = hash_image_stream(xobj, cache)
+            assert cache == {xobj.objgen: digest}
+
+            # A cached digest is returned without re-reading the stream
+            cache[xobj.objgen] = "cached"
+            assert hash_image_stream(xobj, cache) == "cached"
+
+
+class TestPrehashPdfImages:
+    def test_small_document_is_not_prehashed(self, images_pdf: Path) -> None:
+        assert prehash_pdf_images(images_pdf, 1) == {}
+
+    def test_worker_cap_disables_prehash(
+        self, scanned_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(hashing.os, "cpu_count", lambda: 4)
+        monkeypatch.setattr(hashing, "_max_workers", None)
+        hashing.limit_prehash_workers(1)
+        with pikepdf.open(scanned_pdf) as pdf:
+            assert prehash_pdf_images(scanned_pdf, len(pdf.pages), min_pages=1) == {}
+
+    def test_parallel_matches_serial_hashes(
+        self, scanned_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(hashing.os, "cpu_count", lambda: 4)
+        with pikepdf.open(scanned_pdf) as pdf:
+            cache = prehash_pdf_images(scanned_pdf, len(pdf.pages), min_pages=1)
+            expected = {
+                xobj.objgen: hash_image_stream(xobj)
+                for page in pdf.pages
+                for xobj in page["/Resources"]["/XObject"].values()
+                if xobj.get("/Subtype") == pikepdf.Name("/Image")
+            }
+        assert cache
+        assert cache == expected
@@ -8,10 +8,19 @@ from pathlib import Path
 import pikepdf
 import pytest
 
-from accesspdf.alttext.injector import inject_alt_text
+from accesspdf.alttext import injector
+from accesspdf.alttext.injector import (
+    _build_page_index,
+    _create_figure_tags,
+    _get_page_image_hashes,
+    _iter_figures_needing_alt,
+    _page_visit_order,
+    inject_alt_text,
+)
 from accesspdf.alttext.sidecar import AltTextEntry, SidecarFile, SidecarManager
 from accesspdf.models import AltTextStatus
 from accesspdf.pipeline import run_pipeline
+from accesspdf.utils import hashing
 
 
 class TestInjector:
@@ -178,6 +187,44 @@ class TestInjector:
         count = inject_alt_text(output_pdf, sidecar)
         assert count == 0
 
+    def test_fills_existing_figures(self, images_pdf: Path, output_pdf: Path) -> None:
+        """Figures already in the tag tree get /Alt in place -- no duplicates."""
+        sidecar = self._fix_pdf(images_pdf, output_pdf)
+        with pikepdf.open(output_pdf) as pdf:
+            before = len(_find_figures(pdf))
+        assert before == len(sidecar.images)
+
+        for entry in sidecar.images:
+            entry.alt_text = f"Existing {entry.id}"
+            entry.status = AltTextStatus.APPROVED
+
+        count = inject_alt_text(output_pdf, sidecar)
+        assert count == len(sidecar.images)
+
+        with pikepdf.open(output_pdf) as pdf:
+            figures = _find_figures(pdf)
+            assert len(figures) == before
+            assert all(str(f.get("/Alt", "")).startswith("Existing ") for f in figures)
+
+    def test_decorative_fills_existing_figure(self, images_pdf: Path, output_pdf: Path) -> None:
+        """A decorative entry marks its existing /Figure rather than adding one."""
+        sidecar = self._fix_pdf(images_pdf, output_pdf)
+        with pikepdf.open(output_pdf) as pdf:
+            before = len(_find_figures(pdf))
+
+        for entry in sidecar.images:
+            entry.status = AltTextStatus.DECORATIVE
+
+        count = inject_alt_text(output_pdf, sidecar)
+        assert count == len(sidecar.images)
+
+        with pikepdf.open(output_pdf) as pdf:
+            figures = _find_figures(pdf)
+            assert len(figures) == before
+            for fig in figures:
+                assert str(fig["/Alt"]) == ""
+                assert str(fig["/ActualText"]) == ""
+
     def test_idempotent(self, images_pdf: Path, output_pdf: Path) -> None:
         sidecar = self._fix_pdf(images_pdf, output_pdf)
 
@@ -199,6 +246,144 @@ class TestInjector:
         assert count2 >= 0
 
 
+class TestPrehashImages:
+    def test_parallel_injection_matches(
+        self, scanned_pdf: Path, output_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        run_pipeline(scanned_pdf, output_pdf)
+        sidecar = SidecarManager.load(output_pdf.with_suffix(".alttext.yaml"))
+        for entry in sidecar.images:
+            entry.alt_text = f"Parallel {entry.id}"
+            entry.status = AltTextStatus.APPROVED
+            entry.page = 0  # no usable hint, so every page is searched
+
+        monkeypatch.setattr(hashing, "_PARALLEL_MIN_PAGES", 1)
+        monkeypatch.setattr(hashing.os, "cpu_count", lambda: 4)
+        assert sidecar.images
+        assert inject_alt_text(output_pdf, sidecar) == len(sidecar.images)
+
+    def test_hinted_entries_skip_prehash(
+        self, scanned_pdf: Path, output_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        run_pipeline(scanned_pdf, output_pdf)
+        sidecar = SidecarManager.load(output_pdf.with_suffix(".alttext.yaml"))
+        last = max(sidecar.images, key=lambda e: e.page)
+        last.alt_text = "Last page"
+        last.status = AltTextStatus.APPROVED
+        with pikepdf.open(output_pdf) as pdf:
+            assert len(pdf.pages) > 1
+            hinted = {
+                xobj.objgen
+                for xobj in pdf.pages[last.page - 1].Resources.XObject.values()
+            }
+
+        hashed: list[tuple[int, int]] = []
+        real_hash = injector.hash_image_stream
+
+        def recording_hash(xobj, cache=None):  # type: ignore[no-untyped-def]
+            hashed.append(xobj.objgen)
+            return real_hash(xobj, cache)
+
+        monkeypatch.setattr(
+            injector, "prehash_pdf_images",
+            lambda *args: pytest.fail("prehashed despite page hints"),
+        )
+        monkeypatch.setattr(injector, "hash_image_stream", recording_hash)
+        assert inject_alt_text(output_pdf, sidecar) == 1
+        assert hashed
+        assert set(hashed) <= hinted
+
+
+class TestPageImageHashes:
+    def test_cache_reuses_page_hashes(self, images_pdf: Path) -> None:
+        cache: dict[tuple[int, int], list[str]] = {}
+        with pikepdf.open(images_pdf) as pdf:
+            page = pdf.pages[0]
+            first = _get_page_image_hashes(page, cache)
+            assert first == _get_page_image_hashes(page)
+            assert list(cache) == [page.obj.objgen]
+            assert _get_page_image_hashes(page, cache) is first
+
+
+class TestIterFiguresNeedingAlt:
+    def test_tree_order_and_cycle_safe(self) -> None:
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        page = pdf.pages[0].obj
+
+        def fig(alt: str | None = None) -> pikepdf.Dictionary:
+            d = pikepdf.Dictionary(S=pikepdf.Name.Figure, Pg=page)
+            if alt is not None:
+                d.Alt = alt
+            return pdf.make_indirect(d)
+
+        first, done, second = fig(), fig("already"), fig()
+        sect = pdf.make_indirect(pikepdf.Dictionary(
+            S=pikepdf.Name.Sect, K=pikepdf.Array([done, second])
+        ))
+        root = pdf.make_indirect(pikepdf.Dictionary(K=pikepdf.Array([first, sect])))
+        sect.K.append(root)  # loop back to the root
+
+        found = list(_iter_figures_needing_alt(root, _build_page_index(pdf)))
+        assert [n.objgen for n, _ in found] == [first.objgen, second.objgen]
+        assert all(idx == 0 for _, idx in found)
+
+
+class TestCreateFigureTags:
+    def test_new_mcid_above_later_marked_content(self) -> None:
+        """MCIDs that appear after the image in the stream still count."""
+        pdf = pikepdf.new()
+        pdf.add_blank_page()
+        image = pdf.make_stream(
+            b"\x00\xff\x00",
+            Type=pikepdf.Name.XObject, Subtype=pikepdf.Name.Image,
+            Width=1, Height=1, BitsPerComponent=8,
+            ColorSpace=pikepdf.Name.DeviceRGB,
+        )
+        page = pdf.pages[0]
+        page.Resources = pikepdf.Dictionary(XObject=pikepdf.Dictionary(Im0=image))
+        page.Contents = pdf.make_stream(
+            b"/P <</MCID 0>> BDC EMC q /Im0 Do Q /P <</MCID 5>> BDC EMC"
+        )
+        doc = pdf.make_indirect(pikepdf.Dictionary(
+            S=pikepdf.Name.Document, K=pikepdf.Array()
+        ))
+        pdf.Root.StructTreeRoot = pdf.make_indirect(pikepdf.Dictionary(
+            Type=pikepdf.Name.StructTreeRoot, K=pikepdf.Array([doc])
+        ))
+        img_hash = _get_page_image_hashes(page)[0]
+
+        assert _create_figure_tags(pdf, {img_hash: ("A dot", False)}) == 1
+
+        figure = doc.K[0]
+        assert list(figure.K) == [6]
+        bdcs = [
+            ops for ops, op in pikepdf.parse_content_stream(page)
+            if op == pikepdf.Operator("BDC") and str(ops[0]) == "/Figure"
+        ]
+        assert len(bdcs) == 1
+        assert int(bdcs[0][1]["/MCID"]) == 6
+
+    def test_no_match_leaves_parent_tree_alone(
+        self, images_pdf: Path, output_pdf: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        run_pipeline(images_pdf, output_pdf)
+        monkeypatch.setattr(
+            injector, "_rebuild_parent_tree",
+            lambda pdf: pytest.fail("ParentTree rebuilt with no new figures"),
+        )
+        with pikepdf.open(output_pdf) as pdf:
+            assert _create_figure_tags(pdf, {"0" * 32: ("Nothing", False)}) == 0
+
+    def test_hinted_pages_visited_first(self) -> None:
+        order = _page_visit_order(5, {"a": ("", False), "b": ("", False)}, {"a": 3, "b": 1})
+        assert list(order) == [1, 3, 0, 2, 4]
+
+    def test_stale_hints_fall_back_to_every_page(self) -> None:
+        order = _page_visit_order(3, {"a": ("", False)}, {"a": 7, "gone": 0})
+        assert list(order) == [0, 1, 2]
+
+
 def _find_figures(pdf: pikepdf.Pdf) -> list[pikepdf.Dictionary]:
     """Walk the tag tree and find all /Figure elements."""
     figures: list[pikepdf.Dictionary] = []
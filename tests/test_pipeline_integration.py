@@ -42,6 +42,14 @@ class TestPipelineIntegration:
         src_hash_after = hashlib.md5(simple_pdf.read_bytes()).hexdigest()
         assert src_hash_before == src_hash_after
 
+    def test_refuses_to_overwrite_input(self, simple_pdf: Path, tmp_path: Path) -> None:
+        src = tmp_path / "doc.pdf"
+        shutil.copy2(simple_pdf, src)
+        before = src.read_bytes()
+        with pytest.raises(ValueError):
+            run_pipeline(src, tmp_path / "." / "doc.pdf")
+        assert src.read_bytes() == before
+
     def test_output_is_tagged(self, simple_pdf: Path, output_pdf: Path) -> None:
         run_pipeline(simple_pdf, output_pdf)
         with pikepdf.open(output_pdf) as pdf:
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
-from accesspdf.alttext.sidecar import AltTextEntry, SidecarFile, SidecarManager
+from accesspdf.alttext.sidecar import AltTextEntry, SidecarFile, SidecarManager, group_by_hash
 from accesspdf.models import AltTextStatus, ImageInfo
 
 
@@ -81,6 +82,35 @@ class TestSidecarFile:
         found = sc.get_entry_by_id("img_a3f8c2")
         assert found is not None
 
+    def test_lookup_sees_direct_list_changes(self) -> None:
+        sc = SidecarFile(document="test.pdf")
+        sc.upsert(self._make_image("aaa111bbb222"))
+        assert sc.get_entry("ccc333ddd444") is None
+        sc.images.append(AltTextEntry(id="img_ccc333", page=2, hash="ccc333ddd444"))
+        assert sc.get_entry("ccc333ddd444") is sc.images[1]
+        sc.images = []
+        assert sc.get_entry_by_id("img_aaa111") is None
+
+    def test_lookup_sees_in_place_replacement(self) -> None:
+        sc = SidecarFile(document="test.pdf")
+        sc.upsert(self._make_image("aaa111bbb222"))
+        assert sc.get_entry("aaa111bbb222") is sc.images[0]
+        replacement = AltTextEntry(id="img_ccc333", page=2, hash="ccc333ddd444")
+        sc.images[0] = replacement
+        assert sc.get_entry("aaa111bbb222") is None
+        assert sc.get_entry("ccc333ddd444") is replacement
+        sc.images.pop()
+        sc.images.append(AltTextEntry(id="img_eee555", page=3, hash="eee555fff666"))
+        assert sc.get_entry_by_id("img_ccc333") is None
+        assert sc.get_entry_by_id("img_eee555") is sc.images[0]
+
+    def test_duplicate_hash_returns_first(self) -> None:
+        first = AltTextEntry(id="img_aaa111", page=1, hash="aaa111bbb222")
+        second = AltTextEntry(id="img_aaa111", page=3, hash="aaa111bbb222")
+        sc = SidecarFile(document="test.pdf", images=[first, second])
+        assert sc.get_entry("aaa111bbb222") is first
+        assert sc.get_entry_by_id("img_aaa111") is first
+
     def test_approved_entries(self) -> None:
         sc = SidecarFile(document="test.pdf")
         sc.upsert(self._make_image("aaa111bbb222"), status=AltTextStatus.APPROVED)
@@ -107,6 +137,12 @@ class TestSidecarFile:
         assert stats["needs_review"] == 1
         assert stats["decorative"] == 1
 
+    def test_stats_reports_absent_statuses_as_zero(self) -> None:
+        sc = SidecarFile(document="test.pdf")
+        sc.upsert(self._make_image("aaa111"), status=AltTextStatus.APPROVED)
+        stats = sc.stats
+        assert stats == {"total": 1, **{s.value: 0 for s in AltTextStatus}, "approved": 1}
+
 
 class TestSidecarManager:
     def test_sidecar_path_for(self) -> None:
@@ -131,6 +167,20 @@ class TestSidecarManager:
         assert entry.alt_text == "Approved text"
         assert entry.status == AltTextStatus.APPROVED
 
+    def test_trusted_load_matches_validated_load(self, tmp_path: Path) -> None:
+        sc = SidecarFile(document="trusted.pdf")
+        sc.upsert(ImageInfo(image_hash="deadbeef01234567", page=2, width=50, height=50),
+                  alt_text="Approved text", status=AltTextStatus.APPROVED)
+        sc.upsert(ImageInfo(image_hash="0123456789abcdef", page=3, width=5, height=5))
+
+        path = tmp_path / "trusted.alttext.yaml"
+        SidecarManager.save(sc, path)
+
+        trusted = SidecarManager.load(path, trusted=True)
+        assert trusted == SidecarManager.load(path)
+        assert trusted.images[0].status is AltTextStatus.APPROVED
+        assert trusted.get_entry("0123456789abcdef").page == 3
+
     def test_load_sample_sidecar(self, sample_sidecar_yaml: Path) -> None:
         sc = SidecarManager.load(sample_sidecar_yaml)
         assert sc.document == "test.pdf"
@@ -161,6 +211,38 @@ class TestSidecarManager:
         assert sc.document == "test.pdf"
         assert len(sc.images) == 3
 
+    def test_load_or_create_reparses_after_save(
+        self, tmp_path: Path, sample_sidecar_yaml: Path
+    ) -> None:
+        pdf_path = tmp_path / "test.pdf"
+        first, sc_path = SidecarManager.load_or_create(pdf_path)
+        first.images[0].alt_text = "Edited in memory only"
+
+        again, _ = SidecarManager.load_or_create(pdf_path)
+        assert again.images[0].alt_text == ""
+
+        again.images.pop()
+        SidecarManager.save(again, sc_path)
+        reloaded, _ = SidecarManager.load_or_create(pdf_path)
+        assert len(reloaded.images) == 2
+
+    def test_load_or_create_sees_same_size_rewrite(
+        self, tmp_path: Path, sample_sidecar_yaml: Path
+    ) -> None:
+        pdf_path = tmp_path / "test.pdf"
+        first, sc_path = SidecarManager.load_or_create(pdf_path)
+        assert first.images[0].status == AltTextStatus.NEEDS_REVIEW
+
+        st = sc_path.stat()
+        text = sc_path.read_text(encoding="utf-8")
+        edited = text.replace("status: needs_review", "status: approved    ", 1)
+        assert len(edited) == len(text)
+        sc_path.write_text(edited, encoding="utf-8")
+        os.utime(sc_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        again, _ = SidecarManager.load_or_create(pdf_path)
+        assert again.images[0].status == AltTextStatus.APPROVED
+
     def test_idempotent_save(self, tmp_path: Path) -> None:
         """Saving the same sidecar twice produces identical files."""
         sc = SidecarFile(document="idem.pdf")
@@ -175,3 +257,14 @@ class TestSidecarManager:
         content2 = path.read_text(encoding="utf-8")
 
         assert content1 == content2
+
+
+class TestGroupByHash:
+    def test_keeps_first_seen_order(self) -> None:
+        entries = [
+            AltTextEntry(id=f"img_{h[:6]}", page=page, hash=h)
+            for page, h in enumerate(["b" * 32, "a" * 32, "b" * 32], start=1)
+        ]
+        groups = group_by_hash(entries)
+        assert list(groups) == ["b" * 32, "a" * 32]
+        assert [e.page for e in groups["b" * 32]] == [1, 3]
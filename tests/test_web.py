@@ -182,6 +182,40 @@ class TestWebUI:
             time.sleep(0.1)
         assert status["gen_stage"] == "done"
 
+    def test_generate_shares_request_across_duplicate_hashes(
+        self, images_pdf: Path
+    ) -> None:
+        """Sidecar entries with the same image hash get one request and one draft."""
+        import threading
+        from types import SimpleNamespace
+
+        from accesspdf.alttext.extract import extract_all_images
+        from accesspdf.providers.base import AltTextResult
+        from accesspdf.web.app import _generate_alt_text
+
+        first_hash = extract_all_images(images_pdf)[0][0]
+        entries = [
+            SimpleNamespace(id=f"img_{i}", hash=first_hash, page=1, caption="",
+                            context="", ai_draft="")
+            for i in range(2)
+        ]
+        job = SimpleNamespace(
+            output_path=images_pdf, sidecar=SimpleNamespace(document="doc.pdf"),
+            sidecar_lock=threading.Lock(), sidecar_path=None,
+        )
+        calls = []
+
+        class _Provider:
+            async def generate(self, context: object) -> AltTextResult:
+                calls.append(context)
+                return AltTextResult(alt_text="A chart.")
+
+        _generate_alt_text(job, _Provider(), entries)
+
+        assert len(calls) == 1
+        assert [e.ai_draft for e in entries] == ["A chart.", "A chart."]
+        assert job.gen_current == 2 and job.gen_stage == "done"
+
     def test_generate_bad_provider(self, client: TestClient, images_pdf: Path) -> None:
         data = _upload_and_wait(client, images_pdf)
         job_id = data["job_id"]